@@ -38,7 +38,7 @@ show_usage() {
     echo "Options:"
     echo "  --headless     - Run in headless mode (default for CI)"
     echo "  --headed       - Run with visible browser"
-    echo "  --parallel     - Run tests in parallel"
+    echo "  --parallel     - Run tests in parallel (SELENIUM_WORKERS workers, default 2)"
     echo "  --coverage     - Generate coverage report"
     echo "  --html-report  - Generate HTML test report"
     echo "  --verbose      - Verbose output"
@@ -148,7 +148,9 @@ run_tests() {
                 shift
                 ;;
             --parallel)
-                pytest_args+=("-n" "auto")
+                # One worker per test class so each reuses its session browser.
+                # Worker count is capped: every worker runs its own Chrome.
+                pytest_args+=("-n" "${SELENIUM_WORKERS:-2}" "--dist" "loadscope")
                 shift
                 ;;
             --coverage)
@@ -39,6 +39,10 @@ class SmaFractalScalperV2Config:
     # Signal configuration file
     signals_config_path: str = "src/strategies/sma_fractal_scalper_v2/signals.yaml"
     
+    # Parsed indicator/signal configs; when set they are used instead of the files
+    indicators_config: Optional[Dict[str, Any]] = None
+    signals_config: Optional[Dict[str, Any]] = None
+    
     # Chart configuration
     chart_enabled: bool = True
     chart_config_path: str = "src/strategies/sma_fractal_scalper_v2/chart.yaml"
@@ -69,7 +73,8 @@ class SmaFractalScalperV2Config:
         known_params = {
             'risk_per_trade', 'timeframe', 'session_cutoff',
             'sma_short_period', 'sma_long_period', 'use_fractals', 'use_sma', 'fractal_window',
-            'indicators_config_path', 'signals_config_path', 'chart_enabled', 'chart_config_path',
+            'indicators_config_path', 'signals_config_path', 'indicators_config', 'signals_config',
+            'chart_enabled', 'chart_config_path',
             'historical_warmup', 'instrument_id', 'strategy_name', 'description', 'version',
             'author', 'max_position_size', 'max_daily_trades', 'stop_loss_pct', 'take_profit_pct',
             'log_level', 'log_signals', 'log_indicators',
@@ -89,6 +94,8 @@ class SmaFractalScalperV2Config:
                                                 "src/strategies/sma_fractal_scalper_v2/indicators.yaml")
         self.signals_config_path = kwargs.get('signals_config_path', 
                                              "src/strategies/sma_fractal_scalper_v2/signals.yaml")
+        self.indicators_config = kwargs.get('indicators_config', None)
+        self.signals_config = kwargs.get('signals_config', None)
         self.chart_enabled = kwargs.get('chart_enabled', True)
         self.chart_config_path = kwargs.get('chart_config_path', 
                                            "src/strategies/sma_fractal_scalper_v2/chart.yaml")
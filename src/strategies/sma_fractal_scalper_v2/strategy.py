@@ -56,11 +56,17 @@ class SmaFractalScalperV2(BaseStrategy):
         """Load indicator and signal configurations."""
         try:
             # Load indicators
-            self.indicator_manager.load_from_config(self.config.indicators_config_path)
+            if self.config.indicators_config is not None:
+                self.indicator_manager.load_from_dict(self.config.indicators_config)
+            else:
+                self.indicator_manager.load_from_config(self.config.indicators_config_path)
             self.log.info(f"Loaded indicators: {self.indicator_manager.list_indicators()}")
             
             # Load signals
-            self.signal_manager.load_from_config(self.config.signals_config_path)
+            if self.config.signals_config is not None:
+                self.signal_manager.load_from_dict(self.config.signals_config)
+            else:
+                self.signal_manager.load_from_config(self.config.signals_config_path)
             self.log.info(f"Loaded signals: {self.signal_manager.list_signal_generators()}")
             
             # Validate that signal generators have required indicators
@@ -80,12 +86,19 @@ class SmaFractalScalperV2(BaseStrategy):
         """Get warmup requirements from all indicators."""
         return self.indicator_manager.get_warmup_requirements()
     
-    def warmup_indicators(self, historical_data: list) -> None:
-        """Warm up all indicators with historical data."""
+    def warmup_indicators(self, historical_data) -> None:
+        """Warm up all indicators with historical data.
+        
+        Accepts a sequence of bar dicts or an OHLCV DataFrame; the latter
+        lets indicators compute their warmup values in bulk.
+        """
         self.log.info(f"Warming up indicators with {len(historical_data)} bars")
         
-        for bar in historical_data:
-            self.indicator_manager.update_all(bar)
+        if isinstance(historical_data, pd.DataFrame):
+            self.indicator_manager.warmup_from_frame(historical_data)
+        else:
+            for bar in historical_data:
+                self.indicator_manager.update_all(bar)
         
         self.warmup_complete = True
         self.log.info("Indicator warmup complete")
@@ -232,6 +245,17 @@ class SmaFractalScalperV2(BaseStrategy):
     def reset(self) -> None:
         """Reset strategy state."""
         self.position = None
+        self.trades = []
+        self._entry_price = None
+        self._stop_price = None
+        self._entry_ts = None
+        self._entry_oi = None
+        self._last_price = None
+        
+        self._eod_order_id = None
+        self._eod_order_placed = False
+        self._new_positions_blocked = False
+        
         self.last_signal = None
         self.warmup_complete = False
         
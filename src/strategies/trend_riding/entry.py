@@ -2,6 +2,10 @@ from __future__ import annotations
 
 from typing import Sequence
 
+import numpy as np
+
+from utils._njit import NUMBA_AVAILABLE, njit
+
 from .breakout import previous_top_bottom, breakout_signal, Direction
 
 """Entry signal computation for Trend-Riding strategy.
@@ -43,6 +47,17 @@ __all__ = ["compute_signal", "Direction"]
 # ------------------------------------------------------------------
 
 
+@njit("boolean(float64[:], int64, float64)", cache=True)
+def _long_breakout_kernel(prices, period, buffer_pct):
+    """Single pass over the lookback window: is the last close above its top?"""
+    last = len(prices) - 1
+    top = prices[last - period]
+    for i in range(last - period + 1, last):
+        if prices[i] > top:
+            top = prices[i]
+    return prices[last] > top * (1 + buffer_pct / 100)
+
+
 def should_enter(
     prices: Sequence[float], *, period: int = 15, buffer_pct: float = 2.0
 ) -> bool:  # noqa: D401
@@ -50,6 +65,13 @@ def should_enter(
 
     Treats *prices* as closes and returns *True* for LONG breakout.
     """
+    if period >= 1:
+        if len(prices) < period + 1:
+            raise ValueError("Not enough data for breakout calculation")
+        if NUMBA_AVAILABLE:
+            prices = np.asarray(prices, dtype=np.float64)
+        return bool(_long_breakout_kernel(prices, period, float(buffer_pct)))
+
     try:
         sig = compute_signal(
             prices, prices, prices, period=period, buffer_pct=buffer_pct
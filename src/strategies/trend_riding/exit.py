@@ -22,16 +22,11 @@ def should_exit(
         raise ValueError("prices cannot be empty")
     last_price = prices[-1]
     if side == Direction.LONG:
-        if last_price <= entry_price * (1 - sl_pct):
-            return True  # stop-loss hit
-        if last_price >= entry_price * (1 + tp_pct):
-            return True  # take-profit reached
-    else:  # SHORT
-        if last_price >= entry_price * (1 + sl_pct):
-            return True
-        if last_price <= entry_price * (1 - tp_pct):
-            return True
-    return False
+        stop, target = entry_price * (1 - sl_pct), entry_price * (1 + tp_pct)
+        return bool(last_price <= stop or last_price >= target)
+    # SHORT: levels mirror around the entry price
+    stop, target = entry_price * (1 + sl_pct), entry_price * (1 - tp_pct)
+    return bool(last_price >= stop or last_price <= target)
 
 
 __all__ = ["should_exit"]
@@ -22,3 +22,15 @@ def test_report_controller_single(tmp_path):
     assert (out_dir / "AAA.html").exists()
     assert (out_dir / "AAA.csv").exists()
     assert (out_dir / "assets" / "report.css").exists()
+
+
+def test_latest_report_dir_sees_new_runs(tmp_path):
+    date_dir = tmp_path / "backtesting" / "batch" / "2024-01-02"
+    (date_dir / "09-00-00_alpha").mkdir(parents=True)
+    (date_dir / "not-a-run").mkdir()
+
+    assert ReportController.latest_report_dir(root=tmp_path) == date_dir / "09-00-00_alpha"
+
+    # A run added after the first scan must not be hidden by the cache
+    (date_dir / "10-30-00_beta").mkdir()
+    assert ReportController.latest_report_dir(root=tmp_path) == date_dir / "10-30-00_beta"
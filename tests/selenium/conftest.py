@@ -10,19 +10,29 @@ Provides shared fixtures for:
 """
 
 import pytest
+import atexit
 import asyncio
 import subprocess
 import time
 import os
+import re
+import gzip
 import json
+import tracemalloc
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, Generator
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException
+
+from tests.selenium.page_objects.dashboard_page import DashboardPage
+from tests.selenium.page_objects.chart_page import ChartPage
 
 # Test configuration
 TEST_CONFIG = {
@@ -30,9 +40,12 @@ TEST_CONFIG = {
     "dashboard_url": "http://localhost:8000",
     "paper_trading_server_url": "http://localhost:5000",
     "screenshot_dir": "testlogs/screenshots",
+    "debug_dir": "testlogs/debug",
+    "perf_trace_dir": "testlogs/perf",
     "test_data_dir": "tests/data",
     "browser_timeout": 30,
     "server_startup_timeout": 15,
+    "window_size": (1920, 1080),
 }
 
 @pytest.fixture(scope="session")
@@ -47,9 +60,34 @@ def screenshot_dir():
     screenshot_path.mkdir(parents=True, exist_ok=True)
     return screenshot_path
 
+@pytest.fixture(scope="session")
+def debug_dir():
+    """Ensure debug state directory exists."""
+    debug_path = Path(TEST_CONFIG["debug_dir"])
+    debug_path.mkdir(parents=True, exist_ok=True)
+    return debug_path
+
+def _paper_trading_server_healthy() -> bool:
+    """Check whether a paper trading server is already answering health checks."""
+    try:
+        import requests
+        response = requests.get(f"{TEST_CONFIG['paper_trading_server_url']}/health", timeout=5)
+        return response.status_code == 200
+    except Exception:
+        return False
+
 @pytest.fixture(scope="session")
 def paper_trading_server():
-    """Start paper trading server for testing."""
+    """Start paper trading server for testing.
+    
+    An already running server (e.g. started by run_selenium_tests.sh before
+    launching parallel xdist workers) is reused and left running.
+    """
+    if _paper_trading_server_healthy():
+        print("Reusing running paper trading server")
+        yield None
+        return
+    
     print("Starting paper trading server...")
     
     # Start the paper trading server
@@ -82,7 +120,7 @@ def paper_trading_server():
 def chrome_options():
     """Configure Chrome browser options for testing."""
     options = Options()
-    options.add_argument("--headless")  # Run in headless mode for CI/CD
+    options.add_argument("--headless=new")  # Run in headless mode for CI/CD
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
@@ -92,74 +130,365 @@ def chrome_options():
     options.add_argument("--disable-images")  # Faster loading
     return options
 
-@pytest.fixture(scope="function")
-def browser(chrome_options, screenshot_dir):
-    """Create and configure Chrome browser instance."""
+# Installed into every document before page scripts run; records console
+# errors/warnings and uncaught errors in window.__capturedLogs using the
+# same level/message shape as driver.get_log('browser').
+_CONSOLE_CAPTURE_JS = """
+(() => {
+    const logs = window.__capturedLogs = [];
+    const record = (level, args) => logs.push({
+        level: level,
+        message: Array.from(args).map((arg) => arg instanceof Error ? arg.stack || String(arg) : String(arg)).join(' '),
+        timestamp: Date.now()
+    });
+    for (const [method, level] of [['error', 'SEVERE'], ['warn', 'WARNING']]) {
+        const original = console[method].bind(console);
+        console[method] = (...args) => { record(level, args); original(...args); };
+    }
+    window.addEventListener('error', (event) => record('SEVERE', [event.error || event.message]));
+    window.addEventListener('unhandledrejection', (event) => record('SEVERE', [event.reason]));
+})();
+"""
+
+def _create_driver(chrome_options, implicit_wait=TEST_CONFIG["browser_timeout"]):
+    """Start a Chrome driver with the shared test configuration applied."""
     driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(TEST_CONFIG["browser_timeout"])
-    
-    yield driver
-    
-    # Capture screenshot on test failure
+    driver.implicitly_wait(implicit_wait)
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _CONSOLE_CAPTURE_JS})
+    return driver
+
+def _save_failure_screenshot(driver, screenshot_dir):
+    """Save a screenshot if the current test failed."""
     if hasattr(pytest, "current_test_failed") and pytest.current_test_failed:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         screenshot_path = screenshot_dir / f"failure_{timestamp}.png"
         driver.save_screenshot(str(screenshot_path))
         print(f"Screenshot saved: {screenshot_path}")
+
+def _driver_alive(driver) -> bool:
+    """Whether the driver's browser session still responds."""
+    try:
+        driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+def _reset_browser(driver):
+    """Clear cookies and storage and leave the browser on a blank page."""
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        # Storage is unavailable on some pages (e.g. about:blank, error pages)
+        pass
+    driver.delete_all_cookies()
+    driver.get("about:blank")
+
+@pytest.fixture(scope="session")
+def _browser_pool(chrome_options):
+    """Holds the Chrome instance reused by every test requesting ``browser``.
     
-    driver.quit()
+    The driver has no implicit wait: tests using it wait explicitly, and
+    absence checks must not stall for the full timeout.
+    """
+    pool = {"driver": _create_driver(chrome_options, implicit_wait=0)}
+    
+    def quit_driver():
+        pool["driver"].quit()
+    
+    # Make sure Chrome is shut down even if the session is interrupted
+    atexit.register(quit_driver)
+    
+    yield pool
+    
+    atexit.unregister(quit_driver)
+    quit_driver()
+
+# Resources a ``no_render`` test never needs to download
+_NO_RENDER_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+]
 
 @pytest.fixture(scope="function")
-def dashboard_page(browser, paper_trading_server):
-    """Navigate to dashboard page and wait for it to load."""
-    browser.get(TEST_CONFIG["dashboard_url"])
+def browser(request, _browser_pool, chrome_options, screenshot_dir):
+    """Chrome browser instance, reset to a blank page after each test.
+    
+    The underlying driver is shared across the session and replaced if its
+    session has died. Tests marked ``no_render`` run with image and font
+    requests blocked.
+    
+    A fixture built on ``browser`` may hand its page to the next test by
+    setting ``request.node.keep_browser_page`` to its own name before
+    teardown; the page then survives only if the test passed and the next
+    test requests that same fixture.
+    """
+    kept_for = _browser_pool.pop("kept_for", None)
+    if not _driver_alive(_browser_pool["driver"]):
+        _browser_pool["driver"].quit()
+        _browser_pool["driver"] = _create_driver(chrome_options, implicit_wait=0)
+    elif kept_for is not None and kept_for not in request.fixturenames:
+        _reset_browser(_browser_pool["driver"])
+    driver = _browser_pool["driver"]
+    
+    no_render = request.node.get_closest_marker("no_render") is not None
+    if no_render:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _NO_RENDER_BLOCKED_URLS})
+    
+    yield driver
+    
+    # Capture screenshot on test failure
+    _save_failure_screenshot(driver, screenshot_dir)
+    
+    if _driver_alive(driver):
+        if no_render:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+            driver.execute_cdp_cmd("Network.disable", {})
+        keep_for = getattr(request.node, "keep_browser_page", None)
+        if keep_for is not None and not getattr(pytest, "current_test_failed", False):
+            _browser_pool["kept_for"] = keep_for
+        else:
+            _reset_browser(driver)
+
+@pytest.fixture(scope="session")
+def session_browser(chrome_options):
+    """Chrome browser instance shared by every dashboard test in the session."""
+    driver = _create_driver(chrome_options)
+    # Make sure Chrome is shut down even if the session is interrupted
+    atexit.register(driver.quit)
+    
+    yield driver
+    
+    atexit.unregister(driver.quit)
+    driver.quit()
+
+@pytest.fixture(scope="session")
+def dashboard_page(session_browser, paper_trading_server):
+    """Navigate to dashboard page once and wait for it to load.
+    
+    The page is shared across the session; tests that mutate chart state
+    should request ``reset_chart_state``.
+    """
+    session_browser.get(TEST_CONFIG["dashboard_url"])
     
     # Wait for dashboard to load
-    WebDriverWait(browser, TEST_CONFIG["browser_timeout"]).until(
+    WebDriverWait(session_browser, TEST_CONFIG["browser_timeout"]).until(
         EC.presence_of_element_located((By.ID, "trading-dashboard"))
     )
     
-    return browser
+    return session_browser
 
 @pytest.fixture(scope="function")
-def sample_market_data():
-    """Generate sample market data for testing."""
-    return {
-        "bars": [
-            {"timestamp": "2025-07-02T09:15:00", "open": 890.50, "high": 891.20, "low": 889.80, "close": 890.90, "volume": 15000},
-            {"timestamp": "2025-07-02T09:16:00", "open": 890.90, "high": 892.10, "low": 890.30, "close": 891.50, "volume": 18000},
-            {"timestamp": "2025-07-02T09:17:00", "open": 891.50, "high": 893.00, "low": 891.00, "close": 892.75, "volume": 22000},
-            {"timestamp": "2025-07-02T09:18:00", "open": 892.75, "high": 894.50, "low": 892.20, "close": 893.80, "volume": 25000},
-            {"timestamp": "2025-07-02T09:19:00", "open": 893.80, "high": 895.20, "low": 893.50, "close": 894.60, "volume": 20000},
-        ],
-        "signals": [
-            {"timestamp": "2025-07-02T09:17:00", "type": "LONG", "price": 892.75, "stop_loss": 890.50},
-            {"timestamp": "2025-07-02T09:19:00", "type": "SHORT", "price": 894.60, "stop_loss": 896.00},
-        ],
-        "indicators": {
-            "sma_short": [890.70, 891.20, 891.85, 892.40, 893.12],
-            "sma_long": [889.50, 889.55, 889.62, 889.70, 889.78],
-            "fractals": {
-                "highs": [{"timestamp": "2025-07-02T09:18:00", "price": 894.50}],
-                "lows": [{"timestamp": "2025-07-02T09:15:00", "price": 889.80}]
-            }
+def dashboard(dashboard_page):
+    """Dashboard page object bound to the shared dashboard page."""
+    return DashboardPage(dashboard_page)
+
+@pytest.fixture(scope="function")
+def chart(dashboard_page):
+    """Chart page object bound to the shared dashboard page."""
+    return ChartPage(dashboard_page)
+
+@pytest.fixture(autouse=True)
+def dashboard_failure_screenshot(request):
+    """Capture a screenshot of the shared dashboard when a test fails."""
+    yield
+    
+    if "dashboard_page" in request.fixturenames:
+        _save_failure_screenshot(
+            request.getfixturevalue("dashboard_page"),
+            request.getfixturevalue("screenshot_dir"),
+        )
+
+# Timeframe the dashboard's TimeframeManager is showing, or null
+_CURRENT_TIMEFRAME_JS = """
+    const manager = window.dashboard && window.dashboard.timeframeManager;
+    return manager ? manager.getCurrentTimeframe() : null;
+"""
+
+# Switch back to arguments[0] through the TimeframeManager (buttons, chart
+# and indicators) and call back once the reload has finished
+_RESTORE_TIMEFRAME_JS = """
+    const [timeframe, done] = arguments;
+    const manager = window.dashboard && window.dashboard.timeframeManager;
+    if (!manager || manager.getCurrentTimeframe() === timeframe) {
+        done(false);
+        return;
+    }
+    manager.switchTimeframe(timeframe).then(() => done(true), () => done(false));
+"""
+
+@pytest.fixture(scope="function")
+def reset_chart_state(dashboard_page):
+    """Restore window size, timeframe and chart view after a state-mutating test."""
+    timeframe = dashboard_page.execute_script(_CURRENT_TIMEFRAME_JS)
+    
+    yield dashboard_page
+    
+    if timeframe is not None:
+        dashboard_page.set_script_timeout(TEST_CONFIG["browser_timeout"])
+        dashboard_page.execute_async_script(_RESTORE_TIMEFRAME_JS, timeframe)
+    
+    width, height = TEST_CONFIG["window_size"]
+    dashboard_page.set_window_size(width, height)
+    dashboard_page.execute_script("""
+        if (window.chartManager && window.chartManager.applyDefaultViewSettings) {
+            window.chartManager.applyDefaultViewSettings();
+        }
+    """)
+
+@pytest.fixture(scope="function")
+def emulated_viewport(dashboard_page):
+    """Resize the shared page's viewport through CDP device metrics emulation.
+    
+    Yields a ``set_viewport(width, height)`` callable; unlike
+    ``set_window_size`` it does not wait on the window manager. The
+    override is cleared after the test.
+    """
+    def set_viewport(width: int, height: int) -> None:
+        dashboard_page.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+            "width": width,
+            "height": height,
+            "deviceScaleFactor": 1,
+            "mobile": False,
+        })
+    
+    yield set_viewport
+    
+    dashboard_page.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+
+@pytest.fixture(scope="function")
+def reload_dashboard_page(dashboard_page):
+    """Reload the shared dashboard after a test that breaks page globals."""
+    yield dashboard_page
+    
+    wait = WebDriverWait(dashboard_page, TEST_CONFIG["browser_timeout"])
+    old_root = dashboard_page.find_element(By.TAG_NAME, "html")
+    dashboard_page.execute_script("location.reload()")
+    # Wait for the old document to go away so the next test never sees it
+    wait.until(EC.staleness_of(old_root))
+    wait.until(EC.presence_of_element_located((By.ID, "trading-dashboard")))
+
+# Static sample market data shared (read-only) by all tests
+_SAMPLE_MARKET_DATA = {
+    "bars": [
+        {"timestamp": "2025-07-02T09:15:00", "open": 890.50, "high": 891.20, "low": 889.80, "close": 890.90, "volume": 15000},
+        {"timestamp": "2025-07-02T09:16:00", "open": 890.90, "high": 892.10, "low": 890.30, "close": 891.50, "volume": 18000},
+        {"timestamp": "2025-07-02T09:17:00", "open": 891.50, "high": 893.00, "low": 891.00, "close": 892.75, "volume": 22000},
+        {"timestamp": "2025-07-02T09:18:00", "open": 892.75, "high": 894.50, "low": 892.20, "close": 893.80, "volume": 25000},
+        {"timestamp": "2025-07-02T09:19:00", "open": 893.80, "high": 895.20, "low": 893.50, "close": 894.60, "volume": 20000},
+    ],
+    "signals": [
+        {"timestamp": "2025-07-02T09:17:00", "type": "LONG", "price": 892.75, "stop_loss": 890.50},
+        {"timestamp": "2025-07-02T09:19:00", "type": "SHORT", "price": 894.60, "stop_loss": 896.00},
+    ],
+    "indicators": {
+        "sma_short": [890.70, 891.20, 891.85, 892.40, 893.12],
+        "sma_long": [889.50, 889.55, 889.62, 889.70, 889.78],
+        "fractals": {
+            "highs": [{"timestamp": "2025-07-02T09:18:00", "price": 894.50}],
+            "lows": [{"timestamp": "2025-07-02T09:15:00", "price": 889.80}]
         }
     }
+}
+
+def _freeze(value):
+    """Recursively convert dicts/lists into read-only mappings/tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+@lru_cache(maxsize=None)
+def _load_sample_market_data():
+    """Build the sample market data once as an immutable structure."""
+    return _freeze(_SAMPLE_MARKET_DATA)
+
+@pytest.fixture(scope="session")
+def sample_market_data():
+    """Provide read-only sample market data shared by all tests."""
+    return _load_sample_market_data()
+
+class PerformanceMetrics(dict):
+    """Metrics dict whose ``duration`` is the elapsed time until the test ends."""
+    
+    def __missing__(self, key):
+        if key == "duration":
+            return time.perf_counter() - self["start_time"]
+        raise KeyError(key)
 
 @pytest.fixture(scope="function")
-def performance_monitor():
-    """Monitor performance metrics during tests."""
-    start_time = time.time()
-    metrics = {"start_time": start_time}
+def performance_monitor(request):
+    """Monitor performance metrics during tests.
+    
+    Durations are only logged for tests marked ``performance``.
+    """
+    metrics = PerformanceMetrics(start_time=time.perf_counter())
     
     yield metrics
     
-    end_time = time.time()
+    end_time = time.perf_counter()
     metrics["end_time"] = end_time
-    metrics["duration"] = end_time - start_time
+    metrics["duration"] = end_time - metrics["start_time"]
     
     # Log performance metrics
-    print(f"Test duration: {metrics['duration']:.2f} seconds")
+    if request.node.get_closest_marker("performance"):
+        print(f"Test duration: {metrics['duration']:.2f} seconds")
+
+def _cdp_metrics(driver) -> Dict[str, float]:
+    """Return Chrome DevTools performance metrics keyed by name."""
+    driver.execute_cdp_cmd("Performance.enable", {})
+    result = driver.execute_cdp_cmd("Performance.getMetrics", {})
+    return {metric["name"]: metric["value"] for metric in result.get("metrics", [])}
+
+@pytest.fixture(autouse=True)
+def performance_trace(request):
+    """Trace Python allocations and browser metrics for ``performance`` tests.
+    
+    Unmarked tests skip all instrumentation. Traces are written gzipped to
+    ``testlogs/perf/<nodeid>.json.gz``.
+    """
+    if not request.node.get_closest_marker("performance"):
+        yield
+        return
+    
+    driver = None
+    for name in ("dashboard_page", "browser"):
+        if name in request.fixturenames:
+            driver = request.getfixturevalue(name)
+            break
+    
+    metrics_before = _cdp_metrics(driver) if driver else {}
+    tracemalloc.start()
+    
+    yield
+    
+    snapshot = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    metrics_after = _cdp_metrics(driver) if driver else {}
+    
+    trace = {
+        "nodeid": request.node.nodeid,
+        "python_memory": {"current": current, "peak": peak},
+        "top_allocations": [
+            {"location": str(stat.traceback), "size": stat.size, "count": stat.count}
+            for stat in snapshot.statistics("lineno")[:25]
+        ],
+        "browser_metrics": {
+            "before": metrics_before,
+            "after": metrics_after,
+            "delta": {name: metrics_after[name] - value
+                      for name, value in metrics_before.items() if name in metrics_after},
+        },
+    }
+    
+    trace_dir = Path(TEST_CONFIG["perf_trace_dir"])
+    trace_dir.mkdir(parents=True, exist_ok=True)
+    trace_name = re.sub(r"[^\w.-]", "_", request.node.nodeid)
+    trace_path = trace_dir / f"{trace_name}.json.gz"
+    with gzip.open(trace_path, "wt") as f:
+        json.dump(trace, f)
 
 # Hook to capture test failures for screenshot functionality
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -182,4 +511,5 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "selenium: Browser automation tests")
     config.addinivalue_line("markers", "chart: Chart functionality tests")
     config.addinivalue_line("markers", "realtime: Real-time data tests")
-    config.addinivalue_line("markers", "performance: Performance benchmark tests") 
\ No newline at end of file
+    config.addinivalue_line("markers", "performance: Performance benchmark tests")
+    config.addinivalue_line("markers", "no_render: Tests that only inspect DOM/JS state and skip image/font loads")
\ No newline at end of file
@@ -10,11 +10,82 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
 import time
 import json
 
+# Installs ``window.__chartProbe`` and returns its first result. Arguments:
+# indicator name -> selector mapping, buy marker selector, sell marker selector.
+_CHART_PROBE_INSTALL_JS = """(indicatorSelectors, buySelector, sellSelector) => {
+    const isVisible = (el) => !!el && el.getClientRects().length > 0 &&
+        getComputedStyle(el).visibility !== 'hidden';
+    const markers = (selector) => Array.from(document.querySelectorAll(selector))
+        .filter(isVisible)
+        .map((el) => {
+            const rect = el.getBoundingClientRect();
+            return {
+                position: {x: Math.round(rect.left + window.scrollX), y: Math.round(rect.top + window.scrollY)},
+                visible: true,
+                tooltip: el.getAttribute('title') || ''
+            };
+        });
+    const callChartManager = (method) => {
+        try {
+            if (window.chartManager && window.chartManager[method]) {
+                return window.chartManager[method]();
+            }
+            return null;
+        } catch (e) {
+            return null;
+        }
+    };
+    
+    window.__chartProbe = () => ({
+        indicators: Object.keys(indicatorSelectors)
+            .filter((name) => isVisible(document.querySelector(indicatorSelectors[name]))),
+        signals: {buy: markers(buySelector), sell: markers(sellSelector)},
+        priceRange: callChartManager('getPriceRange'),
+        timeRange: callChartManager('getTimeRange')
+    });
+    return window.__chartProbe();
+}"""
+
+_CHART_PROBE_JS = "return (" + _CHART_PROBE_INSTALL_JS + ")(arguments[0], arguments[1], arguments[2]);"
+
+# JS expression: the chart's candlestick series holds at least one bar
+_CHART_HAS_DATA_JS = """(() => {
+    const manager = window.chartManager || (window.dashboard && window.dashboard.chartManager);
+    const series = manager && manager.candlestickSeries;
+    return !!series && typeof series.data === "function" && series.data().length > 0;
+})()"""
+
+# Async chart state probe used by capture_chart_state and capture_page_state.
+# Arguments: the probe install arguments (as a list) and the canvas selector.
+CHART_STATE_JS = """async (probeArgs, canvasSelector) => {
+    const probe = window.__chartProbe ? window.__chartProbe() : (""" + _CHART_PROBE_INSTALL_JS + """)(...probeArgs);
+    const canvas = document.querySelector(canvasSelector);
+    const rect = canvas ? canvas.getBoundingClientRect() : null;
+    let dataIntegrity;
+    try {
+        dataIntegrity = window.chartManager && window.chartManager.validateData
+            ? window.chartManager.validateData()
+            : {valid: false, reason: "No validation method available"};
+    } catch (e) {
+        dataIntegrity = {valid: false, reason: e.message};
+    }
+    return {
+        chart_loaded: !!rect && rect.width > 100 && rect.height > 100,
+        chart_dimensions: rect
+            ? {width: Math.round(rect.width), height: Math.round(rect.height),
+               x: Math.round(rect.left + window.scrollX), y: Math.round(rect.top + window.scrollY)}
+            : {width: 0, height: 0, x: 0, y: 0},
+        probe: probe,
+        data_integrity: dataIntegrity
+    };
+}"""
+
 class ChartPage:
     """Page object for chart-specific interactions."""
     
@@ -36,6 +107,8 @@ class ChartPage:
     
     # Chart controls
     TIMEFRAME_BUTTONS = (By.CSS_SELECTOR, ".timeframe-button")
+    TIMEFRAME_BUTTON_TEMPLATE = ".timeframe-button[data-timeframe='{}']"
+    INDICATOR_TOGGLE_TEMPLATE = ".indicator-toggle[data-indicator='{}']"
     INDICATOR_PANEL = (By.ID, "indicator-panel")
     CHART_SETTINGS = (By.ID, "chart-settings")
     
@@ -51,9 +124,22 @@ class ChartPage:
         self.timeout = timeout
         self.wait = WebDriverWait(driver, timeout)
         self.actions = ActionChains(driver)
+        self._cdp_performance_enabled = False
+        # A positive is_chart_loaded() result holds until the page is mutated
+        self._state_epoch = 0
+        self._loaded_epoch = None
+    
+    def invalidate(self) -> None:
+        """Forget cached page state after the page has been changed."""
+        self._state_epoch += 1
     
     def is_chart_loaded(self) -> bool:
-        """Check if chart is fully loaded and rendered."""
+        """Check if chart is fully loaded and rendered.
+        
+        A positive result is cached until ``invalidate()`` is called.
+        """
+        if self._loaded_epoch == self._state_epoch:
+            return True
         try:
             # Wait for chart container
             self.wait.until(EC.presence_of_element_located(self.CHART_CONTAINER))
@@ -63,7 +149,10 @@ class ChartPage:
             
             # Check if chart has actual dimensions
             canvas = self.driver.find_element(*self.CHART_CANVAS)
-            return canvas.size['width'] > 100 and canvas.size['height'] > 100
+            loaded = canvas.size['width'] > 100 and canvas.size['height'] > 100
+            if loaded:
+                self._loaded_epoch = self._state_epoch
+            return loaded
         except TimeoutException:
             return False
     
@@ -71,19 +160,11 @@ class ChartPage:
         """Wait for chart to load with actual market data."""
         try:
             # Execute JavaScript to check if chart has data
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                has_data = self.driver.execute_script("""
-                    try {
-                        // Check if chart instance exists and has data
-                        if (window.chartManager && window.chartManager.chart) {
-                            return true;
-                        }
-                        return false;
-                    } catch (e) {
-                        return false;
-                    }
-                """)
+            start_time = time.perf_counter()
+            while time.perf_counter() - start_time < timeout:
+                has_data = self.driver.execute_script(
+                    "try { return " + _CHART_HAS_DATA_JS + "; } catch (e) { return false; }"
+                )
                 
                 if has_data:
                     return True
@@ -106,60 +187,72 @@ class ChartPage:
         except Exception:
             return {"width": 0, "height": 0, "x": 0, "y": 0}
     
-    def get_visible_indicators(self) -> List[str]:
-        """Get list of currently visible indicators."""
-        indicators = []
+    def probe_chart(self) -> Dict[str, Any]:
+        """Collect indicators, signals and visible ranges in a single DOM pass.
         
+        The probe is installed on ``window`` on first use (and again after a
+        page reload); later calls only invoke it.
+        """
         try:
-            # Check SMA indicators
-            if self._is_element_visible(self.SMA_SHORT_LINE):
-                indicators.append("SMA_SHORT")
-            if self._is_element_visible(self.SMA_LONG_LINE):
-                indicators.append("SMA_LONG")
-            
-            # Check fractal indicators
-            if self._is_element_visible(self.FRACTAL_HIGHS):
-                indicators.append("FRACTAL_HIGHS")
-            if self._is_element_visible(self.FRACTAL_LOWS):
-                indicators.append("FRACTAL_LOWS")
+            probe = self.driver.execute_script(
+                "return window.__chartProbe ? window.__chartProbe() : null;"
+            )
+            if probe is None:
+                probe = self.driver.execute_script(_CHART_PROBE_JS, *self.probe_arguments())
+            return probe or {}
         except Exception:
-            pass
+            return {}
+    
+    def probe_arguments(self) -> List[Any]:
+        """Arguments for installing the chart probe in the page."""
+        return [
+            {
+                "SMA_SHORT": self.SMA_SHORT_LINE[1],
+                "SMA_LONG": self.SMA_LONG_LINE[1],
+                "FRACTAL_HIGHS": self.FRACTAL_HIGHS[1],
+                "FRACTAL_LOWS": self.FRACTAL_LOWS[1],
+            },
+            self.BUY_MARKERS[1],
+            self.SELL_MARKERS[1],
+        ]
+    
+    def state_probe_arguments(self) -> List[Any]:
+        """Arguments for ``CHART_STATE_JS``."""
+        return [self.probe_arguments(), self.CHART_CANVAS[1]]
+    
+    def wait_for_stable_dimensions(self, timeout: float = 3, poll_frequency: float = 0.1) -> bool:
+        """Wait until the chart canvas reports the same size on consecutive polls."""
+        previous: Dict[str, Any] = {}
+        
+        def settled(_driver) -> bool:
+            dimensions = self.get_chart_dimensions()
+            stable = dimensions == previous.get("dimensions") and dimensions["width"] > 0
+            previous["dimensions"] = dimensions
+            return stable
         
-        return indicators
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency).until(settled)
+            return True
+        except TimeoutException:
+            return False
+    
+    def get_visible_indicators(self) -> List[str]:
+        """Get list of currently visible indicators."""
+        return self.probe_chart().get("indicators") or []
     
     def get_trading_signals_on_chart(self) -> Dict[str, List[Dict]]:
         """Get trading signals displayed on chart."""
-        signals = {"buy": [], "sell": []}
-        
-        try:
-            # Get buy markers
-            buy_markers = self.driver.find_elements(*self.BUY_MARKERS)
-            for marker in buy_markers:
-                if marker.is_displayed():
-                    signals["buy"].append({
-                        "position": marker.location,
-                        "visible": True,
-                        "tooltip": marker.get_attribute("title") or ""
-                    })
-            
-            # Get sell markers
-            sell_markers = self.driver.find_elements(*self.SELL_MARKERS)
-            for marker in sell_markers:
-                if marker.is_displayed():
-                    signals["sell"].append({
-                        "position": marker.location,
-                        "visible": True,
-                        "tooltip": marker.get_attribute("title") or ""
-                    })
-        except Exception:
-            pass
-        
-        return signals
+        return self.probe_chart().get("signals") or {"buy": [], "sell": []}
     
-    def hover_over_chart_point(self, x_percent: float, y_percent: float) -> Dict[str, Any]:
-        """Hover over a specific point on the chart and get crosshair info."""
+    def hover_over_chart_point(self, x_percent: float, y_percent: float,
+                               timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Hover over a specific point on the chart and get crosshair info.
+        
+        ``timeout`` bounds the element lookup and settle time, so failure
+        paths return quickly instead of waiting out the implicit wait.
+        """
         try:
-            canvas = self.driver.find_element(*self.CHART_CANVAS)
+            canvas = self._find_element(self.CHART_CANVAS, timeout)
             
             # Calculate absolute position
             width = canvas.size['width']
@@ -169,7 +262,7 @@ class ChartPage:
             
             # Move to position
             self.actions.move_to_element_with_offset(canvas, x_offset, y_offset).perform()
-            time.sleep(0.5)
+            time.sleep(self._settle_time(0.5, timeout))
             
             # Get crosshair information via JavaScript
             crosshair_info = self.driver.execute_script("""
@@ -205,8 +298,9 @@ class ChartPage:
         except Exception:
             return False
     
-    def zoom_chart(self, zoom_factor: float) -> bool:
-        """Zoom chart by specified factor."""
+    def zoom_chart(self, zoom_factor: float, timeout: Optional[float] = None) -> bool:
+        """Zoom chart by specified factor, settling for at most ``timeout`` seconds."""
+        self.invalidate()
         try:
             result = self.driver.execute_script(f"""
                 try {{
@@ -219,13 +313,14 @@ class ChartPage:
                     return false;
                 }}
             """)
-            time.sleep(1)
+            time.sleep(self._settle_time(1, timeout))
             return result
         except Exception:
             return False
     
     def pan_chart(self, direction: str, amount: int = 50) -> bool:
         """Pan chart in specified direction."""
+        self.invalidate()
         try:
             canvas = self.driver.find_element(*self.CHART_CANVAS)
             
@@ -262,60 +357,34 @@ class ChartPage:
     
     def get_chart_price_range(self) -> Dict[str, Optional[float]]:
         """Get visible price range on chart."""
-        try:
-            price_range = self.driver.execute_script("""
-                try {
-                    if (window.chartManager && window.chartManager.getPriceRange) {
-                        return window.chartManager.getPriceRange();
-                    }
-                    return null;
-                } catch (e) {
-                    return null;
-                }
-            """)
-            
-            return price_range or {"min": None, "max": None}
-        except Exception:
-            return {"min": None, "max": None}
+        return self.probe_chart().get("priceRange") or {"min": None, "max": None}
     
     def get_chart_time_range(self) -> Dict[str, Optional[str]]:
         """Get visible time range on chart."""
-        try:
-            time_range = self.driver.execute_script("""
-                try {
-                    if (window.chartManager && window.chartManager.getTimeRange) {
-                        return window.chartManager.getTimeRange();
-                    }
-                    return null;
-                } catch (e) {
-                    return null;
-                }
-            """)
-            
-            return time_range or {"start": None, "end": None}
-        except Exception:
-            return {"start": None, "end": None}
+        return self.probe_chart().get("timeRange") or {"start": None, "end": None}
     
-    def switch_timeframe(self, timeframe: str) -> bool:
-        """Switch chart timeframe."""
+    def switch_timeframe(self, timeframe: str, timeout: Optional[float] = None) -> bool:
+        """Switch chart timeframe, waiting at most ``timeout`` seconds when given."""
+        self.invalidate()
         try:
             # Find timeframe button
-            timeframe_button = self.driver.find_element(
-                By.CSS_SELECTOR, f".timeframe-button[data-timeframe='{timeframe}']"
+            timeframe_button = self._find_element(
+                self._locator(self.TIMEFRAME_BUTTON_TEMPLATE, timeframe), timeout
             )
             timeframe_button.click()
             
             # Wait for chart to update
-            time.sleep(2)
+            time.sleep(self._settle_time(2, timeout))
             return True
         except Exception:
             return False
     
     def toggle_indicator_visibility(self, indicator: str) -> bool:
         """Toggle indicator visibility on chart."""
+        self.invalidate()
         try:
             toggle_button = self.driver.find_element(
-                By.CSS_SELECTOR, f".indicator-toggle[data-indicator='{indicator}']"
+                *self._locator(self.INDICATOR_TOGGLE_TEMPLATE, indicator)
             )
             toggle_button.click()
             time.sleep(1)
@@ -327,7 +396,7 @@ class ChartPage:
         """Measure chart rendering performance."""
         try:
             # Start performance measurement
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Trigger chart update
             self.driver.execute_script("""
@@ -339,7 +408,7 @@ class ChartPage:
             # Wait for update to complete
             time.sleep(1)
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             # Get performance metrics via JavaScript
             performance_data = self.driver.execute_script("""
@@ -362,6 +431,89 @@ class ChartPage:
         except Exception:
             return {}
     
+    def measure_chart_performance_cdp(self) -> Dict[str, Any]:
+        """Measure chart rendering performance via Chrome DevTools metrics.
+        
+        Reads ``Performance.getMetrics`` around a forced chart update instead
+        of evaluating a measurement script in the page.
+        """
+        try:
+            if not self._cdp_performance_enabled:
+                self.driver.execute_cdp_cmd("Performance.enable", {})
+                self._cdp_performance_enabled = True
+            
+            before = self._get_cdp_metrics()
+            
+            # Trigger chart update and return once the next frame is painted
+            self.driver.execute_async_script("""
+                const done = arguments[arguments.length - 1];
+                if (window.chartManager && window.chartManager.forceUpdate) {
+                    window.chartManager.forceUpdate();
+                }
+                requestAnimationFrame(() => done(true));
+            """)
+            
+            after = self._get_cdp_metrics()
+            
+            return {
+                "update_duration": after.get("TaskDuration", 0) - before.get("TaskDuration", 0),
+                "js_performance": {
+                    "memoryUsage": after.get("JSHeapUsedSize"),
+                    "totalMemory": after.get("JSHeapTotalSize"),
+                    "nodes": after.get("Nodes"),
+                    "layoutCount": after.get("LayoutCount"),
+                    "recalcStyleCount": after.get("RecalcStyleCount"),
+                },
+                "timestamp": time.time()
+            }
+        except Exception:
+            return {}
+    
+    def measure_chart_load_time(self, timeout: int = 15) -> Optional[float]:
+        """Reload the page and return seconds from navigation start to chart data.
+        
+        The candlestick series is checked for bars on each animation frame
+        and the elapsed time is taken from Chrome DevTools timestamps, so the
+        result is not inflated by Python-side polling intervals. Returns None
+        if no data arrives within ``timeout`` seconds.
+        """
+        self.invalidate()
+        try:
+            if not self._cdp_performance_enabled:
+                self.driver.execute_cdp_cmd("Performance.enable", {})
+                self._cdp_performance_enabled = True
+            
+            self.driver.refresh()
+            
+            chart_ready = self.driver.execute_async_script("""
+                const timeoutMs = arguments[0];
+                const done = arguments[arguments.length - 1];
+                const start = performance.now();
+                const hasData = () => { try { return """ + _CHART_HAS_DATA_JS + """; } catch (e) { return false; } };
+                const check = () => {
+                    if (hasData()) {
+                        done(true);
+                    } else if (performance.now() - start > timeoutMs) {
+                        done(false);
+                    } else {
+                        requestAnimationFrame(check);
+                    }
+                };
+                check();
+            """, timeout * 1000)
+            if not chart_ready:
+                return None
+            
+            metrics = self._get_cdp_metrics()
+            return metrics["Timestamp"] - metrics["NavigationStart"]
+        except (TimeoutException, WebDriverException):
+            return None
+    
+    def _get_cdp_metrics(self) -> Dict[str, float]:
+        """Return Chrome DevTools performance metrics keyed by name."""
+        result = self.driver.execute_cdp_cmd("Performance.getMetrics", {})
+        return {metric["name"]: metric["value"] for metric in result.get("metrics", [])}
+    
     def wait_for_real_time_update(self, timeout: int = 30) -> bool:
         """Wait for real-time chart update."""
         try:
@@ -378,8 +530,8 @@ class ChartPage:
             """)
             
             # Wait for state to change
-            start_time = time.time()
-            while time.time() - start_time < timeout:
+            start_time = time.perf_counter()
+            while time.perf_counter() - start_time < timeout:
                 current_state = self.driver.execute_script("""
                     try {
                         if (window.chartManager && window.chartManager.getLastUpdateTime) {
@@ -417,24 +569,56 @@ class ChartPage:
         except Exception:
             return {"valid": False, "reason": "Exception during validation"}
     
-    def _is_element_visible(self, locator: Tuple[By, str]) -> bool:
-        """Check if element is visible on page."""
+    def _find_element(self, locator: Tuple[By, str], timeout: Optional[float] = None):
+        """Find element, bounding the lookup by ``timeout`` seconds when given."""
+        if timeout is None:
+            return self.driver.find_element(*locator)
+        
+        # Suspend the implicit wait so it cannot outlast the explicit timeout
+        implicit_wait = self.driver.timeouts.implicit_wait
+        self.driver.implicitly_wait(0)
         try:
-            element = self.driver.find_element(*locator)
-            return element.is_displayed()
-        except Exception:
-            return False
+            return WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located(locator)
+            )
+        finally:
+            self.driver.implicitly_wait(implicit_wait)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _locator(template: str, value: str) -> Tuple[str, str]:
+        """Build (and memoize) a CSS locator from a selector template."""
+        return (By.CSS_SELECTOR, template.format(value))
+    
+    @staticmethod
+    def _settle_time(default: float, timeout: Optional[float]) -> float:
+        """Return the post-action settle delay, capped by ``timeout``."""
+        return default if timeout is None else min(default, timeout)
     
     def capture_chart_state(self) -> Dict[str, Any]:
         """Capture complete chart state for debugging."""
+        try:
+            raw_state = self.driver.execute_async_script(
+                "const done = arguments[arguments.length - 1];"
+                "(" + CHART_STATE_JS + ")(arguments[0], arguments[1])"
+                ".then(done, (e) => done({error: e.message}));",
+                *self.state_probe_arguments()
+            )
+        except Exception:
+            raw_state = {}
+        return self.chart_state_from_probe(raw_state or {})
+    
+    def chart_state_from_probe(self, raw_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the debug chart state from a ``CHART_STATE_JS`` result."""
+        probe = raw_state.get("probe") or {}
         return {
-            "chart_loaded": self.is_chart_loaded(),
-            "chart_dimensions": self.get_chart_dimensions(),
-            "visible_indicators": self.get_visible_indicators(),
-            "trading_signals": self.get_trading_signals_on_chart(),
-            "price_range": self.get_chart_price_range(),
-            "time_range": self.get_chart_time_range(),
-            "performance": self.measure_chart_performance(),
-            "data_integrity": self.validate_chart_data_integrity(),
+            "chart_loaded": raw_state.get("chart_loaded", False),
+            "chart_dimensions": raw_state.get("chart_dimensions") or {"width": 0, "height": 0, "x": 0, "y": 0},
+            "visible_indicators": probe.get("indicators") or [],
+            "trading_signals": probe.get("signals") or {"buy": [], "sell": []},
+            "price_range": probe.get("priceRange") or {"min": None, "max": None},
+            "time_range": probe.get("timeRange") or {"start": None, "end": None},
+            "performance": self.measure_chart_performance_cdp(),
+            "data_integrity": raw_state.get("data_integrity") or {"valid": False, "reason": "Unknown error"},
             "timestamp": time.time()
-        } 
\ No newline at end of file
+        }
@@ -14,6 +14,90 @@ from typing import Dict, List, Optional, Any
 import time
 import json
 
+# Async dashboard state probe used by capture_dashboard_state and
+# capture_page_state. Arguments: element name -> CSS selector mapping,
+# buy signal selector, sell signal selector, chart canvas selector.
+DASHBOARD_STATE_JS = """async (elementSelectors, buySelector, sellSelector, canvasSelector) => {
+    const isVisible = (el) => !!el && el.getClientRects().length > 0 &&
+        getComputedStyle(el).visibility !== 'hidden';
+    const describe = (selector) => {
+        const el = document.querySelector(selector);
+        return el ? {text: el.innerText, className: el.className || '', visible: isVisible(el)} : null;
+    };
+    const signals = (selector, type) => Array.from(document.querySelectorAll(selector)).map((el) => {
+        const rect = el.getBoundingClientRect();
+        return {
+            type: type,
+            visible: isVisible(el),
+            text: el.innerText,
+            position: {x: Math.round(rect.left + window.scrollX), y: Math.round(rect.top + window.scrollY)}
+        };
+    });
+    const canvas = document.querySelector(canvasSelector);
+    const rect = canvas ? canvas.getBoundingClientRect() : null;
+    return {
+        elements: Object.fromEntries(
+            Object.entries(elementSelectors).map(([name, selector]) => [name, describe(selector)])
+        ),
+        trading_signals: [...signals(buySelector, 'BUY'), ...signals(sellSelector, 'SELL')],
+        chart_dimensions: rect
+            ? {width: Math.round(rect.width), height: Math.round(rect.height)}
+            : {width: 0, height: 0}
+    };
+}"""
+
+# Describes each element of a name -> CSS selector mapping (arguments[0]).
+_DESCRIBE_ELEMENTS_JS = """
+    const isVisible = (el) => !!el && el.getClientRects().length > 0 &&
+        getComputedStyle(el).visibility !== 'hidden';
+    return Object.fromEntries(Object.entries(arguments[0]).map(([name, selector]) => {
+        const el = document.querySelector(selector);
+        return [name, el ? {text: el.innerText, className: el.className || '', visible: isVisible(el)} : null];
+    }));
+"""
+
+# Describes every buy (arguments[0]) and sell (arguments[1]) signal element
+# in one call instead of several WebDriver round trips per element.
+_TRADING_SIGNALS_JS = """
+    const isVisible = (el) => el.getClientRects().length > 0 &&
+        getComputedStyle(el).visibility !== 'hidden';
+    const signals = (selector, type) => Array.from(document.querySelectorAll(selector)).map((el) => {
+        const rect = el.getBoundingClientRect();
+        return {
+            type: type,
+            visible: isVisible(el),
+            text: el.innerText,
+            position: {x: Math.round(rect.left + window.scrollX), y: Math.round(rect.top + window.scrollY)}
+        };
+    });
+    return [...signals(arguments[0], 'BUY'), ...signals(arguments[1], 'SELL')];
+"""
+
+# Resolves (via the async callback) with true on the first real-time update
+# pushed through the dashboard's DataService or on the first change of the
+# last-update element, and with false after arguments[0] milliseconds.
+_WAIT_FOR_DATA_UPDATE_JS = """
+    const [timeoutMs, lastUpdateSelector, done] = arguments;
+    const service = window.dashboard && window.dashboard.dataService;
+    const eventTypes = ['bar_update', 'indicator_update'];
+    const target = document.querySelector(lastUpdateSelector);
+    let observer = null;
+    let timer = null;
+    const onUpdate = () => finish(true);
+    const finish = (updated) => {
+        clearTimeout(timer);
+        if (observer) observer.disconnect();
+        if (service) eventTypes.forEach((type) => service.unsubscribe(type, onUpdate));
+        done(updated);
+    };
+    if (service) eventTypes.forEach((type) => service.subscribe(type, onUpdate));
+    if (target) {
+        observer = new MutationObserver(onUpdate);
+        observer.observe(target, {childList: true, characterData: true, subtree: true});
+    }
+    timer = setTimeout(() => finish(false), timeoutMs);
+"""
+
 class DashboardPage:
     """Page object for the trading dashboard."""
     
@@ -49,17 +133,33 @@ class DashboardPage:
     BUY_SIGNALS = (By.CSS_SELECTOR, ".buy-signal")
     SELL_SIGNALS = (By.CSS_SELECTOR, ".sell-signal")
     
+    # Status panel fields read by get_all_status_snapshot
+    STATUS_SNAPSHOT_FIELDS = ("strategy_status", "broker_status", "account_balance", "pnl", "trade_count")
+    
     def __init__(self, driver: WebDriver, timeout: int = 30):
         """Initialize dashboard page object."""
         self.driver = driver
         self.timeout = timeout
         self.wait = WebDriverWait(driver, timeout)
+        # A positive is_loaded() result holds until the page is mutated
+        self._state_epoch = 0
+        self._loaded_epoch = None
+    
+    def invalidate(self) -> None:
+        """Forget cached page state after the page has been changed."""
+        self._state_epoch += 1
     
     def is_loaded(self) -> bool:
-        """Check if dashboard is fully loaded."""
+        """Check if dashboard is fully loaded.
+        
+        A positive result is cached until ``invalidate()`` is called.
+        """
+        if self._loaded_epoch == self._state_epoch:
+            return True
         try:
             self.wait.until(EC.presence_of_element_located(self.DASHBOARD_CONTAINER))
             self.wait.until(EC.presence_of_element_located(self.CHART_CONTAINER))
+            self._loaded_epoch = self._state_epoch
             return True
         except TimeoutException:
             return False
@@ -176,32 +276,14 @@ class DashboardPage:
     
     def get_trading_signals(self) -> List[Dict[str, Any]]:
         """Get all visible trading signals."""
-        signals = []
-        
         try:
-            # Get buy signals
-            buy_signals = self.driver.find_elements(*self.BUY_SIGNALS)
-            for signal in buy_signals:
-                signals.append({
-                    "type": "BUY",
-                    "visible": signal.is_displayed(),
-                    "text": signal.text,
-                    "position": signal.location
-                })
-            
-            # Get sell signals
-            sell_signals = self.driver.find_elements(*self.SELL_SIGNALS)
-            for signal in sell_signals:
-                signals.append({
-                    "type": "SELL",
-                    "visible": signal.is_displayed(),
-                    "text": signal.text,
-                    "position": signal.location
-                })
+            return self.driver.execute_script(
+                _TRADING_SIGNALS_JS,
+                self._css_selector(self.BUY_SIGNALS),
+                self._css_selector(self.SELL_SIGNALS),
+            ) or []
         except Exception:
-            pass
-        
-        return signals
+            return []
     
     def change_timeframe(self, timeframe: str) -> bool:
         """Change chart timeframe."""
@@ -262,22 +344,31 @@ class DashboardPage:
             return False
     
     def wait_for_data_update(self, timeout: int = 10) -> bool:
-        """Wait for real-time data to update."""
+        """Wait for real-time data to update.
+
+        Blocks in the browser on a one-shot listener and returns as soon as
+        the first bar/indicator update or last-update change arrives, rather
+        than polling the DOM once a second up to ``timeout``.
+        """
+        previous_script_timeout = self.driver.timeouts.script
         try:
-            # Get initial timestamp
-            initial_update = self.driver.find_element(*self.LAST_UPDATE).text
-            
-            # Wait for timestamp to change
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                current_update = self.driver.find_element(*self.LAST_UPDATE).text
-                if current_update != initial_update:
-                    return True
-                time.sleep(1)
-            
-            return False
+            self.driver.set_script_timeout(timeout + 5)
+            return bool(self.driver.execute_async_script(
+                _WAIT_FOR_DATA_UPDATE_JS, timeout * 1000, self._css_selector(self.LAST_UPDATE)
+            ))
         except Exception:
             return False
+        finally:
+            self.driver.set_script_timeout(previous_script_timeout)
+    
+    def get_console_logs(self) -> List[Dict[str, Any]]:
+        """Console errors/warnings recorded in the page since it loaded.
+        
+        Entries are collected in-page by the capture script the test driver
+        installs on every new document, so reading them costs one call and
+        nothing is lost to driver log buffer rotation.
+        """
+        return self.driver.execute_script("return window.__capturedLogs || [];")
     
     def get_chart_dimensions(self) -> Dict[str, int]:
         """Get chart canvas dimensions."""
@@ -316,19 +407,130 @@ class DashboardPage:
         except ValueError:
             return 0.0
     
+    @staticmethod
+    def _css_selector(locator) -> str:
+        """CSS selector equivalent of an ID or CSS locator."""
+        by, value = locator
+        return f"#{value}" if by == By.ID else value
+    
+    def state_probe_arguments(self) -> List[Any]:
+        """Arguments for ``DASHBOARD_STATE_JS``."""
+        css = self._css_selector
+        return [
+            {
+                "strategy_status": css(self.STRATEGY_STATUS),
+                "broker_status": css(self.BROKER_STATUS),
+                "account_balance": css(self.BALANCE_DISPLAY),
+                "pnl": css(self.PNL_DISPLAY),
+                "trade_count": css(self.TRADE_COUNT),
+                "current_price": css(self.CURRENT_PRICE),
+                "price_change": css(self.PRICE_CHANGE),
+                "connection_status": css(self.CONNECTION_STATUS),
+            },
+            css(self.BUY_SIGNALS),
+            css(self.SELL_SIGNALS),
+            css(self.CHART_CANVAS),
+        ]
+    
     def capture_dashboard_state(self) -> Dict[str, Any]:
         """Capture complete dashboard state for debugging."""
+        try:
+            raw_state = self.driver.execute_async_script(
+                "const done = arguments[arguments.length - 1];"
+                "(" + DASHBOARD_STATE_JS + ")(arguments[0], arguments[1], arguments[2], arguments[3])"
+                ".then(done, (e) => done({error: e.message}));",
+                *self.state_probe_arguments()
+            )
+        except Exception:
+            raw_state = {}
+        return self.dashboard_state_from_probe(raw_state or {})
+    
+    def get_all_status_snapshot(self) -> Dict[str, Any]:
+        """Read strategy, broker, balance, P&L and trade count in one round trip.
+        
+        Returns the same shapes as the individual status getters.
+        """
+        selectors = self.state_probe_arguments()[0]
+        try:
+            elements = self.driver.execute_script(
+                _DESCRIBE_ELEMENTS_JS,
+                {name: selectors[name] for name in self.STATUS_SNAPSHOT_FIELDS}
+            ) or {}
+        except Exception:
+            elements = {}
+        return self._status_fields_from_elements(elements)
+    
+    def _status_fields_from_elements(self, elements: Dict[str, Any]) -> Dict[str, Any]:
+        """Map described status-panel elements to the getter result shapes."""
+        missing = {"text": "", "className": "", "visible": False}
+        
+        strategy = elements.get("strategy_status") or missing
+        broker = elements.get("broker_status") or missing
+        balance = elements.get("account_balance")
+        pnl = elements.get("pnl") or missing
+        trade_count = elements.get("trade_count")
+        
+        try:
+            trades = int(trade_count["text"].split()[0]) if trade_count else 0
+        except (ValueError, IndexError):
+            trades = 0
+        
+        return {
+            "strategy_status": {
+                "text": strategy["text"],
+                "is_active": "active" in strategy["className"],
+                "visible": strategy["visible"]
+            },
+            "broker_status": {
+                "text": broker["text"],
+                "is_connected": "connected" in broker["className"],
+                "visible": broker["visible"]
+            },
+            "account_balance": balance["text"] if balance else None,
+            "pnl": {
+                "text": pnl["text"],
+                "value": self._extract_numeric_value(pnl["text"]),
+                "is_positive": "positive" in pnl["className"],
+                "is_negative": "negative" in pnl["className"]
+            },
+            "trade_count": trades,
+        }
+    
+    def dashboard_state_from_probe(self, raw_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the debug dashboard state from a ``DASHBOARD_STATE_JS`` result.
+        
+        Mirrors the individual getters, including their fallbacks for
+        missing elements.
+        """
+        elements = raw_state.get("elements") or {}
+        missing = {"text": "", "className": "", "visible": False}
+        
+        current_price = elements.get("current_price")
+        change = elements.get("price_change") or missing
+        connection = elements.get("connection_status")
+        
+        if connection:
+            connection_status = {
+                "text": connection["text"],
+                "is_connected": "connected" in connection["className"],
+                "is_disconnected": "disconnected" in connection["className"],
+                "is_reconnecting": "reconnecting" in connection["className"]
+            }
+        else:
+            connection_status = {"text": "", "is_connected": False, "is_disconnected": True, "is_reconnecting": False}
+        
         return {
-            "strategy_status": self.get_strategy_status(),
-            "broker_status": self.get_broker_status(),
-            "account_balance": self.get_account_balance(),
-            "pnl": self.get_pnl_display(),
-            "trade_count": self.get_trade_count(),
-            "current_price": self.get_current_price(),
-            "price_change": self.get_price_change(),
-            "connection_status": self.get_connection_status(),
-            "trading_signals": self.get_trading_signals(),
-            "chart_dimensions": self.get_chart_dimensions(),
+            **self._status_fields_from_elements(elements),
+            "current_price": self._extract_numeric_value(current_price["text"]) if current_price else None,
+            "price_change": {
+                "text": change["text"],
+                "value": self._extract_numeric_value(change["text"]),
+                "is_positive": "positive" in change["className"] or "up" in change["className"],
+                "is_negative": "negative" in change["className"] or "down" in change["className"]
+            },
+            "connection_status": connection_status,
+            "trading_signals": raw_state.get("trading_signals") or [],
+            "chart_dimensions": raw_state.get("chart_dimensions") or {"width": 0, "height": 0},
             "chart_interactive": self.is_chart_interactive(),
             "timestamp": time.time()
-        } 
\ No newline at end of file
+        }
@@ -0,0 +1,57 @@
+"""
+Combined dashboard and chart state capture.
+
+Runs the dashboard and chart state probes concurrently in the browser and
+returns both results from a single WebDriver round trip.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Any
+
+from tests.selenium.page_objects.dashboard_page import DashboardPage, DASHBOARD_STATE_JS
+from tests.selenium.page_objects.chart_page import ChartPage, CHART_STATE_JS
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover – dependency may be optional
+    orjson = None
+
+_PAGE_STATE_JS = """
+    const done = arguments[arguments.length - 1];
+    const dashboardProbe = """ + DASHBOARD_STATE_JS + """;
+    const chartProbe = """ + CHART_STATE_JS + """;
+    Promise.all([dashboardProbe(...arguments[0]), chartProbe(...arguments[1])])
+        .then(([dashboard, chart]) => done({dashboard: dashboard, chart: chart}))
+        .catch((e) => done({error: e.message}));
+"""
+
+def capture_page_state(dashboard: DashboardPage, chart: ChartPage) -> Dict[str, Any]:
+    """Capture dashboard and chart debug state with one async script call."""
+    try:
+        raw_state = dashboard.driver.execute_async_script(
+            _PAGE_STATE_JS,
+            dashboard.state_probe_arguments(),
+            chart.state_probe_arguments(),
+        ) or {}
+    except Exception:
+        raw_state = {}
+    
+    return {
+        "dashboard": dashboard.dashboard_state_from_probe(raw_state.get("dashboard") or {}),
+        "chart": chart.chart_state_from_probe(raw_state.get("chart") or {}),
+    }
+
+def write_debug_state(path: Path, state: Dict[str, Any]) -> None:
+    """Write debug state as indented JSON.
+    
+    Uses orjson when available; otherwise the document is streamed through
+    ``JSONEncoder.iterencode`` so the full JSON string is never held in memory.
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2, default=str))
+        return
+    
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in json.JSONEncoder(indent=2, default=str).iterencode(state):
+            f.write(chunk)
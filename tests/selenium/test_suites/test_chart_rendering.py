@@ -15,8 +15,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from tests.selenium.page_objects.dashboard_page import DashboardPage
 from tests.selenium.page_objects.chart_page import ChartPage
+from tests.selenium.page_objects.page_state import capture_page_state, write_debug_state
 
 @pytest.mark.selenium
 @pytest.mark.chart
@@ -24,11 +24,8 @@ from tests.selenium.page_objects.chart_page import ChartPage
 class TestChartRendering:
     """Production tests for core chart rendering functionality."""
     
-    def test_chart_loads_successfully(self, dashboard_page, performance_monitor):
+    def test_chart_loads_successfully(self, dashboard, chart):
         """Test that chart loads and renders successfully."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         # Verify dashboard loads
         assert dashboard.is_loaded(), "Dashboard should load successfully"
         
@@ -39,15 +36,9 @@ class TestChartRendering:
         dimensions = chart.get_chart_dimensions()
         assert dimensions['width'] > 100, "Chart should have meaningful width"
         assert dimensions['height'] > 100, "Chart should have meaningful height"
-        
-        # Performance check
-        assert performance_monitor['duration'] < 10, "Chart should load within 10 seconds"
     
-    def test_chart_displays_market_data(self, dashboard_page, sample_market_data):
+    def test_chart_displays_market_data(self, chart, sample_market_data):
         """Test that chart displays actual market data."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         # Wait for chart to load with data
         assert chart.wait_for_chart_data(), "Chart should load with market data"
         
@@ -57,58 +48,50 @@ class TestChartRendering:
         assert price_range['max'] is not None, "Chart should have maximum price"
         assert price_range['max'] > price_range['min'], "Max price should be greater than min"
     
-    def test_chart_responsive_design(self, dashboard_page):
+    @pytest.mark.usefixtures("reset_chart_state")
+    @pytest.mark.parametrize("width,height", [(1920, 1080), (1366, 768), (1024, 768)])
+    def test_chart_responsive_design(self, dashboard_page, chart, width, height):
         """Test chart responsiveness to different screen sizes."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
+        dashboard_page.set_window_size(width, height)
+        time.sleep(1)
         
-        # Test different window sizes
-        test_sizes = [(1920, 1080), (1366, 768), (1024, 768)]
-        
-        for width, height in test_sizes:
-            dashboard_page.set_window_size(width, height)
-            time.sleep(1)
-            
-            # Verify chart adapts to new size
-            dimensions = chart.get_chart_dimensions()
-            assert dimensions['width'] > 0, f"Chart should adapt to {width}x{height}"
-            assert dimensions['height'] > 0, f"Chart should adapt to {width}x{height}"
+        # Verify chart adapts to new size
+        dimensions = chart.get_chart_dimensions()
+        assert dimensions['width'] > 0, f"Chart should adapt to {width}x{height}"
+        assert dimensions['height'] > 0, f"Chart should adapt to {width}x{height}"
     
-    def test_chart_data_integrity(self, dashboard_page):
+    def test_chart_data_integrity(self, chart):
         """Test chart data integrity and validation."""
-        chart = ChartPage(dashboard_page)
-        
         # Validate chart data
         validation = chart.validate_chart_data_integrity()
         assert validation['valid'], f"Chart data should be valid: {validation.get('reason', 'Unknown error')}"
 
+@pytest.fixture(scope="class")
+def visible_indicators(dashboard_page):
+    """Read the visible chart indicators once for the read-only indicator tests."""
+    chart = ChartPage(dashboard_page)
+    
+    # Wait for chart to load
+    assert chart.is_chart_loaded(), "Chart should be loaded"
+    
+    return chart.get_visible_indicators()
+
 @pytest.mark.selenium
 @pytest.mark.chart
 @pytest.mark.dev
 class TestChartIndicators:
     """Development tests for chart indicator functionality."""
     
-    def test_sma_indicators_display(self, dashboard_page):
+    def test_sma_indicators_display(self, visible_indicators):
         """Test SMA indicator lines are displayed on chart."""
-        chart = ChartPage(dashboard_page)
-        
-        # Wait for chart to load
-        assert chart.is_chart_loaded(), "Chart should be loaded"
-        
         # Check for SMA indicators
-        indicators = chart.get_visible_indicators()
-        assert "SMA_SHORT" in indicators, "Short SMA should be visible"
-        assert "SMA_LONG" in indicators, "Long SMA should be visible"
+        assert "SMA_SHORT" in visible_indicators, "Short SMA should be visible"
+        assert "SMA_LONG" in visible_indicators, "Long SMA should be visible"
     
-    def test_fractal_indicators_display(self, dashboard_page):
+    def test_fractal_indicators_display(self, visible_indicators):
         """Test fractal high/low indicators are displayed."""
-        chart = ChartPage(dashboard_page)
-        
-        # Wait for chart to load
-        assert chart.is_chart_loaded(), "Chart should be loaded"
-        
         # Check for fractal indicators
-        indicators = chart.get_visible_indicators()
+        indicators = visible_indicators
         # Note: Fractals may not always be visible depending on data
         # This is a development test to verify the functionality exists
         if "FRACTAL_HIGHS" in indicators or "FRACTAL_LOWS" in indicators:
@@ -117,10 +100,8 @@ class TestChartIndicators:
             # Log for development debugging
             print("No fractal indicators visible - check data or implementation")
     
-    def test_indicator_toggle_functionality(self, dashboard_page):
+    def test_indicator_toggle_functionality(self, chart):
         """Test toggling indicators on/off."""
-        chart = ChartPage(dashboard_page)
-        
         # Get initial indicator state
         initial_indicators = chart.get_visible_indicators()
         
@@ -129,6 +110,9 @@ class TestChartIndicators:
             time.sleep(1)
             new_indicators = chart.get_visible_indicators()
             
+            # Restore the shared page for the tests that follow
+            chart.toggle_indicator_visibility("sma_short")
+            
             # Verify indicator state changed
             sma_short_initially_visible = "SMA_SHORT" in initial_indicators
             sma_short_now_visible = "SMA_SHORT" in new_indicators
@@ -136,10 +120,8 @@ class TestChartIndicators:
             assert sma_short_initially_visible != sma_short_now_visible, \
                 "SMA short indicator should toggle visibility"
     
-    def test_trading_signals_on_chart(self, dashboard_page):
+    def test_trading_signals_on_chart(self, chart):
         """Test trading signals are displayed on chart."""
-        chart = ChartPage(dashboard_page)
-        
         # Wait for chart to load
         assert chart.is_chart_loaded(), "Chart should be loaded"
         
@@ -150,14 +132,11 @@ class TestChartIndicators:
         total_signals = len(signals['buy']) + len(signals['sell'])
         print(f"Found {total_signals} trading signals on chart")
         
-        # Verify signal structure if signals exist
-        for buy_signal in signals['buy']:
-            assert 'position' in buy_signal, "Buy signal should have position"
-            assert 'visible' in buy_signal, "Buy signal should have visibility status"
-        
-        for sell_signal in signals['sell']:
-            assert 'position' in sell_signal, "Sell signal should have position"
-            assert 'visible' in sell_signal, "Sell signal should have visibility status"
+        # Verify signal structure if signals exist (message only built on failure)
+        all_signals = (*signals['buy'], *signals['sell'])
+        assert all('position' in s and 'visible' in s for s in all_signals), \
+            "Signals should have position and visibility status: " \
+            f"{[s for s in all_signals if 'position' not in s or 'visible' not in s]}"
 
 @pytest.mark.selenium
 @pytest.mark.chart
@@ -166,10 +145,8 @@ class TestChartIndicators:
 class TestChartRealTimeUpdates:
     """Development tests for real-time chart updates."""
     
-    def test_chart_updates_with_live_data(self, dashboard_page):
+    def test_chart_updates_with_live_data(self, chart):
         """Test chart updates with real-time market data."""
-        chart = ChartPage(dashboard_page)
-        
         # Wait for chart to load
         assert chart.is_chart_loaded(), "Chart should be loaded"
         
@@ -182,12 +159,10 @@ class TestChartRealTimeUpdates:
             # This is acceptable during development/testing
             print("No real-time update received - check market hours or data feed")
     
-    def test_chart_performance_during_updates(self, dashboard_page, performance_monitor):
+    def test_chart_performance_during_updates(self, chart, performance_monitor):
         """Test chart performance during real-time updates."""
-        chart = ChartPage(dashboard_page)
-        
         # Measure chart performance
-        performance = chart.measure_chart_performance()
+        performance = chart.measure_chart_performance_cdp()
         
         assert performance.get('update_duration', 0) < 1.0, \
             "Chart updates should complete within 1 second"
@@ -202,13 +177,12 @@ class TestChartRealTimeUpdates:
 @pytest.mark.selenium
 @pytest.mark.chart
 @pytest.mark.dev
+@pytest.mark.usefixtures("reset_chart_state")
 class TestChartInteractions:
     """Development tests for chart user interactions."""
     
-    def test_chart_hover_functionality(self, dashboard_page):
+    def test_chart_hover_functionality(self, chart):
         """Test chart hover shows crosshair and price info."""
-        chart = ChartPage(dashboard_page)
-        
         # Wait for chart to load
         assert chart.is_chart_loaded(), "Chart should be loaded"
         
@@ -222,10 +196,8 @@ class TestChartInteractions:
         else:
             print("No crosshair info returned - check implementation")
     
-    def test_chart_zoom_functionality(self, dashboard_page):
+    def test_chart_zoom_functionality(self, chart):
         """Test chart zoom in/out functionality."""
-        chart = ChartPage(dashboard_page)
-        
         # Wait for chart to load
         assert chart.is_chart_loaded(), "Chart should be loaded"
         
@@ -245,10 +217,8 @@ class TestChartInteractions:
         else:
             print("Zoom functionality not available - check implementation")
     
-    def test_chart_pan_functionality(self, dashboard_page):
+    def test_chart_pan_functionality(self, chart):
         """Test chart pan left/right functionality."""
-        chart = ChartPage(dashboard_page)
-        
         # Wait for chart to load
         assert chart.is_chart_loaded(), "Chart should be loaded"
         
@@ -263,10 +233,8 @@ class TestChartInteractions:
             else:
                 print(f"Pan {direction} functionality not available")
     
-    def test_timeframe_switching(self, dashboard_page):
+    def test_timeframe_switching(self, chart):
         """Test switching between different timeframes."""
-        chart = ChartPage(dashboard_page)
-        
         # Wait for chart to load
         assert chart.is_chart_loaded(), "Chart should be loaded"
         
@@ -289,17 +257,12 @@ class TestChartInteractions:
 class TestChartPerformance:
     """Production tests for chart performance benchmarks."""
     
-    def test_chart_load_time_benchmark(self, dashboard_page, performance_monitor):
+    def test_chart_load_time_benchmark(self, chart, performance_monitor):
         """Test chart loads within acceptable time limits."""
-        chart = ChartPage(dashboard_page)
-        
-        start_time = time.time()
-        
-        # Wait for chart to load completely
+        # Reload the shared page and time navigation start -> chart data ready
+        load_time = chart.measure_chart_load_time()
+        assert load_time is not None, "Chart should load with data"
         assert chart.is_chart_loaded(), "Chart should load"
-        assert chart.wait_for_chart_data(), "Chart should load with data"
-        
-        load_time = time.time() - start_time
         
         # Performance benchmarks
         assert load_time < 5.0, f"Chart should load within 5 seconds, took {load_time:.2f}s"
@@ -307,15 +270,13 @@ class TestChartPerformance:
         # Log performance for monitoring
         print(f"Chart load time: {load_time:.2f} seconds")
     
-    def test_chart_memory_usage(self, dashboard_page):
+    def test_chart_memory_usage(self, chart):
         """Test chart memory usage stays within limits."""
-        chart = ChartPage(dashboard_page)
-        
         # Wait for chart to load
         assert chart.is_chart_loaded(), "Chart should be loaded"
         
         # Measure performance
-        performance = chart.measure_chart_performance()
+        performance = chart.measure_chart_performance_cdp()
         js_perf = performance.get('js_performance', {})
         
         if js_perf.get('memoryUsage'):
@@ -331,44 +292,34 @@ class TestChartPerformance:
 class TestChartDebugging:
     """Debug tests for chart troubleshooting."""
     
-    def test_capture_chart_state_for_debugging(self, dashboard_page):
+    def test_capture_chart_state_for_debugging(self, dashboard, chart, debug_dir):
         """Capture complete chart state for debugging purposes."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         # Capture complete state
-        dashboard_state = dashboard.capture_dashboard_state()
-        chart_state = chart.capture_chart_state()
+        page_state = capture_page_state(dashboard, chart)
+        dashboard_state = page_state["dashboard"]
+        chart_state = page_state["chart"]
         
         # Log state for debugging
         print(f"Dashboard state: {dashboard_state}")
         print(f"Chart state: {chart_state}")
         
         # Save state to file for analysis
-        import json
-        from pathlib import Path
-        
-        debug_dir = Path("testlogs/debug")
-        debug_dir.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = int(time.time())
-        with open(debug_dir / f"chart_state_{timestamp}.json", "w") as f:
-            json.dump({
-                "dashboard": dashboard_state,
-                "chart": chart_state
-            }, f, indent=2)
+        timestamp = time.time_ns()
+        write_debug_state(debug_dir / f"chart_state_{timestamp}.json", {
+            "dashboard": dashboard_state,
+            "chart": chart_state
+        })
         
         assert True, "Chart state captured for debugging"
     
-    def test_chart_error_handling(self, dashboard_page):
+    @pytest.mark.usefixtures("reset_chart_state")
+    def test_chart_error_handling(self, chart):
         """Test chart handles errors gracefully."""
-        chart = ChartPage(dashboard_page)
-        
         # Try to trigger various error conditions
         error_tests = [
-            ("Invalid zoom", lambda: chart.zoom_chart(-1)),
-            ("Invalid timeframe", lambda: chart.switch_timeframe("INVALID")),
-            ("Invalid hover", lambda: chart.hover_over_chart_point(200, 200)),
+            ("Invalid zoom", lambda: chart.zoom_chart(-1, timeout=0.5)),
+            ("Invalid timeframe", lambda: chart.switch_timeframe("INVALID", timeout=0.5)),
+            ("Invalid hover", lambda: chart.hover_over_chart_point(200, 200, timeout=0.5)),
         ]
         
         for test_name, test_func in error_tests:
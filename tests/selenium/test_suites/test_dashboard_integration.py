@@ -10,22 +10,17 @@ Tests the interaction between all dashboard components:
 
 import pytest
 import time
-import json
-from pathlib import Path
+from selenium.webdriver.support.ui import WebDriverWait
 
-from tests.selenium.page_objects.dashboard_page import DashboardPage
-from tests.selenium.page_objects.chart_page import ChartPage
+from tests.selenium.page_objects.page_state import capture_page_state, write_debug_state
 
 @pytest.mark.selenium
 @pytest.mark.prod
 class TestDashboardIntegration:
     """Production tests for complete dashboard integration."""
     
-    def test_dashboard_loads_completely(self, dashboard_page, performance_monitor):
+    def test_dashboard_loads_completely(self, dashboard, chart):
         """Test complete dashboard loads with all components."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         # Verify all major components load
         assert dashboard.is_loaded(), "Dashboard should load"
         assert chart.is_chart_loaded(), "Chart should load"
@@ -40,15 +35,9 @@ class TestDashboardIntegration:
         # Verify account information
         balance = dashboard.get_account_balance()
         assert balance is not None, "Account balance should be displayed"
-        
-        # Performance check
-        assert performance_monitor['duration'] < 15, "Complete dashboard should load within 15 seconds"
     
-    def test_real_time_data_flow_integration(self, dashboard_page):
+    def test_real_time_data_flow_integration(self, dashboard, chart):
         """Test real-time data flows correctly between components."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         # Get initial states
         initial_price = dashboard.get_current_price()
         initial_connection = dashboard.get_connection_status()
@@ -71,11 +60,8 @@ class TestDashboardIntegration:
         else:
             print("No real-time update received - check market hours or data feed")
     
-    def test_trading_signal_coordination(self, dashboard_page):
+    def test_trading_signal_coordination(self, dashboard, chart):
         """Test trading signals are coordinated between chart and status panels."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         # Get trading signals from both chart and dashboard
         dashboard_signals = dashboard.get_trading_signals()
         chart_signals = chart.get_trading_signals_on_chart()
@@ -92,16 +78,15 @@ class TestDashboardIntegration:
         else:
             print("No trading signals currently active - normal during testing")
     
-    def test_status_panel_accuracy(self, dashboard_page):
+    def test_status_panel_accuracy(self, dashboard):
         """Test status panel displays accurate information."""
-        dashboard = DashboardPage(dashboard_page)
-        
-        # Get all status information
-        strategy_status = dashboard.get_strategy_status()
-        broker_status = dashboard.get_broker_status()
-        balance = dashboard.get_account_balance()
-        pnl = dashboard.get_pnl_display()
-        trade_count = dashboard.get_trade_count()
+        # Get all status information in a single round trip
+        status = dashboard.get_all_status_snapshot()
+        strategy_status = status['strategy_status']
+        broker_status = status['broker_status']
+        balance = status['account_balance']
+        pnl = status['pnl']
+        trade_count = status['trade_count']
         
         # Verify status information is reasonable
         assert strategy_status['text'] != "", "Strategy status should have text"
@@ -123,11 +108,9 @@ class TestDashboardIntegration:
 class TestDashboardDevelopment:
     """Development tests for dashboard functionality."""
     
-    def test_dashboard_responsive_behavior(self, dashboard_page):
+    @pytest.mark.usefixtures("reset_chart_state")
+    def test_dashboard_responsive_behavior(self, dashboard, chart, emulated_viewport):
         """Test dashboard responds properly to different screen sizes."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         # Test different screen sizes
         screen_sizes = [
             (1920, 1080, "Desktop Large"),
@@ -137,8 +120,9 @@ class TestDashboardDevelopment:
         ]
         
         for width, height, description in screen_sizes:
-            dashboard_page.set_window_size(width, height)
-            time.sleep(2)
+            emulated_viewport(width, height)
+            dashboard.invalidate()
+            chart.wait_for_stable_dimensions()
             
             # Verify dashboard remains functional
             assert dashboard.is_loaded(), f"Dashboard should work on {description}"
@@ -150,11 +134,9 @@ class TestDashboardDevelopment:
             
             print(f"{description} ({width}x{height}): Chart {chart_dimensions['width']}x{chart_dimensions['height']}")
     
-    def test_dashboard_error_recovery(self, dashboard_page):
+    @pytest.mark.usefixtures("reload_dashboard_page")
+    def test_dashboard_error_recovery(self, dashboard, chart, dashboard_page):
         """Test dashboard recovers from various error conditions."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         # Simulate various error conditions
         error_tests = [
             ("Network interruption", self._simulate_network_error),
@@ -165,9 +147,10 @@ class TestDashboardDevelopment:
         for test_name, test_func in error_tests:
             try:
                 test_func(dashboard_page)
-                time.sleep(2)
+                dashboard.invalidate()
+                chart.invalidate()
                 
-                # Verify dashboard recovers
+                # Verify dashboard recovers (both checks wait for the page)
                 assert dashboard.is_loaded(), f"Dashboard should recover from {test_name}"
                 assert chart.is_chart_loaded(), f"Chart should recover from {test_name}"
                 
@@ -175,41 +158,45 @@ class TestDashboardDevelopment:
             except Exception as e:
                 print(f"{test_name}: Error during test - {str(e)}")
     
-    def test_dashboard_performance_monitoring(self, dashboard_page, performance_monitor):
+    @pytest.mark.usefixtures("reset_chart_state")
+    def test_dashboard_performance_monitoring(self, dashboard, chart, performance_monitor):
         """Test dashboard performance under various conditions."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         # Measure performance of various operations
-        operations = [
-            ("Chart zoom", lambda: chart.zoom_chart(1.5)),
-            ("Timeframe switch", lambda: chart.switch_timeframe("5MIN")),
-            ("Status refresh", lambda: dashboard.get_strategy_status()),
-            ("Signal check", lambda: dashboard.get_trading_signals()),
-        ]
+        operations = (
+            ("Chart zoom", chart.zoom_chart, (1.5,)),
+            ("Timeframe switch", chart.switch_timeframe, ("5MIN",)),
+            ("Status refresh", dashboard.get_strategy_status, ()),
+            ("Signal check", dashboard.get_trading_signals, ()),
+        )
         
-        performance_results = {}
+        performance_results = []
         
-        for operation_name, operation_func in operations:
-            start_time = time.time()
+        for operation_name, operation_func, args in operations:
+            start_time = time.perf_counter()
             try:
-                operation_func()
-                duration = time.time() - start_time
-                performance_results[operation_name] = duration
+                operation_func(*args)
+                duration = time.perf_counter() - start_time
+                performance_results.append((operation_name, duration))
                 
                 # Performance thresholds for development
                 assert duration < 2.0, f"{operation_name} should complete within 2 seconds"
                 
             except Exception as e:
-                performance_results[operation_name] = f"Error: {str(e)}"
+                performance_results.append((operation_name, f"Error: {str(e)}"))
         
-        print(f"Performance results: {performance_results}")
+        print(f"Performance results: {dict(performance_results)}")
     
     def _simulate_network_error(self, driver):
-        """Simulate network error condition."""
-        # This would typically involve mocking network requests
-        # For now, just test that the dashboard handles missing data gracefully
-        pass
+        """Simulate network error condition by taking the browser offline."""
+        conditions = {"latency": 0, "downloadThroughput": -1, "uploadThroughput": -1}
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", {"offline": True, **conditions})
+        try:
+            # Wait until the page has seen the outage before going back online
+            WebDriverWait(driver, 5).until(lambda d: d.execute_script("return !navigator.onLine"))
+        finally:
+            driver.execute_cdp_cmd("Network.emulateNetworkConditions", {"offline": False, **conditions})
+            driver.execute_cdp_cmd("Network.disable", {})
     
     def _simulate_chart_error(self, driver):
         """Simulate chart error condition."""
@@ -232,35 +219,32 @@ class TestDashboardDevelopment:
 class TestDashboardDebugging:
     """Debug tests for dashboard troubleshooting."""
     
-    def test_capture_complete_dashboard_state(self, dashboard_page):
+    def test_capture_complete_dashboard_state(self, dashboard, chart, dashboard_page, debug_dir):
         """Capture complete dashboard state for debugging."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         # Capture all state information
         complete_state = {
-            "dashboard": dashboard.capture_dashboard_state(),
-            "chart": chart.capture_chart_state(),
+            **capture_page_state(dashboard, chart),
             "browser_info": {
                 "window_size": dashboard_page.get_window_size(),
                 "url": dashboard_page.current_url,
                 "title": dashboard_page.title
             },
-            "performance": {
-                "page_load_time": dashboard_page.execute_script("return performance.timing.loadEventEnd - performance.timing.navigationStart"),
-                "dom_ready_time": dashboard_page.execute_script("return performance.timing.domContentLoadedEventEnd - performance.timing.navigationStart")
-            }
+            "performance": dashboard_page.execute_script("""
+                const t = performance.timing;
+                const nav = performance.getEntriesByType('navigation')[0];
+                return {
+                    page_load_time: t.loadEventEnd - t.navigationStart,
+                    dom_ready_time: t.domContentLoadedEventEnd - t.navigationStart,
+                    navigation_entry: nav ? nav.toJSON() : {}
+                };
+            """)
         }
         
         # Save state for analysis
-        debug_dir = Path("testlogs/debug")
-        debug_dir.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = int(time.time())
+        timestamp = time.time_ns()
         state_file = debug_dir / f"dashboard_state_{timestamp}.json"
         
-        with open(state_file, "w") as f:
-            json.dump(complete_state, f, indent=2, default=str)
+        write_debug_state(state_file, complete_state)
         
         print(f"Complete dashboard state saved to: {state_file}")
         
@@ -270,10 +254,10 @@ class TestDashboardDebugging:
         assert "browser_info" in complete_state
         assert "performance" in complete_state
     
-    def test_dashboard_console_errors(self, dashboard_page):
+    def test_dashboard_console_errors(self, dashboard):
         """Check for JavaScript console errors."""
         # Get console logs
-        logs = dashboard_page.get_log('browser')
+        logs = dashboard.get_console_logs()
         
         # Filter for errors
         errors = [log for log in logs if log['level'] == 'SEVERE']
@@ -294,13 +278,20 @@ class TestDashboardDebugging:
     
     def test_dashboard_accessibility_check(self, dashboard_page):
         """Basic accessibility check for dashboard."""
-        dashboard = DashboardPage(dashboard_page)
+        # Probe title, images and inputs in one round trip
+        probe = dashboard_page.execute_script("""
+            return {
+                title: document.title,
+                images_missing_alt: document.querySelectorAll('img:not([alt])').length,
+                inputs_missing_label: document.querySelectorAll('input:not([aria-label]):not([aria-labelledby])').length
+            };
+        """)
         
         # Check for basic accessibility features
         accessibility_checks = {
-            "title": dashboard_page.title != "",
-            "alt_texts": len(dashboard_page.find_elements(By.CSS_SELECTOR, "img:not([alt])")) == 0,
-            "form_labels": len(dashboard_page.find_elements(By.CSS_SELECTOR, "input:not([aria-label]):not([aria-labelledby])")) == 0,
+            "title": probe["title"] != "",
+            "alt_texts": probe["images_missing_alt"] == 0,
+            "form_labels": probe["inputs_missing_label"] == 0,
             "color_contrast": True,  # Would require specialized tools
             "keyboard_navigation": True  # Would require specialized testing
         }
@@ -322,19 +313,16 @@ class TestDashboardDebugging:
 class TestDashboardPerformance:
     """Production performance tests for dashboard."""
     
-    def test_dashboard_load_performance(self, dashboard_page, performance_monitor):
+    def test_dashboard_load_performance(self, dashboard, chart, performance_monitor):
         """Test dashboard meets performance requirements."""
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         # Measure complete load time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         assert dashboard.is_loaded(), "Dashboard should load"
         assert chart.is_chart_loaded(), "Chart should load"
         assert chart.wait_for_chart_data(timeout=10), "Chart should load with data"
         
-        total_load_time = time.time() - start_time
+        total_load_time = time.perf_counter() - start_time
         
         # Performance requirements
         assert total_load_time < 10.0, f"Dashboard should load within 10 seconds, took {total_load_time:.2f}s"
@@ -367,17 +355,14 @@ class TestDashboardPerformance:
         else:
             print("Memory monitoring not available in this browser")
     
-    def test_dashboard_cpu_usage(self, dashboard_page):
+    def test_dashboard_cpu_usage(self, dashboard, chart):
         """Test dashboard CPU usage during operation."""
         # This is a simplified CPU usage test
         # In practice, you'd use more sophisticated monitoring
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Perform various operations
-        dashboard = DashboardPage(dashboard_page)
-        chart = ChartPage(dashboard_page)
-        
         operations = [
             lambda: dashboard.get_strategy_status(),
             lambda: chart.get_chart_dimensions(),
@@ -387,11 +372,10 @@ class TestDashboardPerformance:
         
         for operation in operations:
             operation()
-            time.sleep(0.1)
         
-        operation_time = time.time() - start_time
+        operation_time = time.perf_counter() - start_time
         
         # Operations should complete quickly
-        assert operation_time < 5.0, f"Dashboard operations should be fast, took {operation_time:.2f}s"
+        assert operation_time < 2.0, f"Dashboard operations should be fast, took {operation_time:.2f}s"
         
         print(f"Dashboard operation time: {operation_time:.2f} seconds") 
\ No newline at end of file
@@ -9,22 +9,198 @@ Specific tests to validate fixes for:
 """
 
 import pytest
+import re
 import time
 import json
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, JavascriptException
+from selenium.common.exceptions import (
+    TimeoutException,
+    JavascriptException,
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+)
 
 from tests.selenium.page_objects.dashboard_page import DashboardPage
 from tests.selenium.page_objects.chart_page import ChartPage
 
+# Keywords identifying TradingView API failures in console errors
+TRADINGVIEW_CONSOLE_KEYWORDS = (
+    'assertion failed', 'addseries', 'candlestick', 'lightweightcharts',
+    'cannot read properties', 'typeerror', 'addlineseries'
+)
+# Same check for severe browser log entries (narrower keyword set)
+TRADINGVIEW_BROWSER_LOG_PATTERN = re.compile(r"assertion failed|addseries|candlestick|typeerror", re.IGNORECASE)
+
+# Log panel the candlestick-test page writes its status messages to
+LOGS_PANEL = (By.ID, "logs")
+
+# Whether the rendered page text (not the HTML source) contains arguments[0]
+PAGE_TEXT_CONTAINS_JS = "return document.body !== null && document.body.innerText.includes(arguments[0]);"
+
+# Number of entries in the test page's #logs panel
+LOG_COUNT_JS = "document.querySelectorAll('#logs div').length"
+
+# Reused page probes; values are passed as script arguments so each source
+# string stays identical between calls
+LIBRARY_LOADED_JS = "return typeof LightweightCharts !== 'undefined';"
+CHART_CANVAS_EXISTS_JS = "return document.querySelector('#trading-chart canvas') !== null;"
+# Number of #logs entries containing any of the strings in arguments[0]
+LOG_MATCH_COUNT_JS = """
+    const needles = arguments[0];
+    return Array.from(document.querySelectorAll('#logs div'))
+        .filter((log) => needles.some((needle) => log.textContent.includes(needle)))
+        .length;
+"""
+
+def wait_for_js(browser, expression, timeout=10):
+    """Wait until a JavaScript expression is truthy and return its value."""
+    return WebDriverWait(browser, timeout).until(
+        lambda driver: driver.execute_script("return " + expression)
+    )
+
+def robust_click(browser, locator, timeout=10):
+    """Click an element once clickable, retrying briefly if it goes stale or is covered."""
+    wait = WebDriverWait(browser, timeout)
+    for delay in (0.05, 0.15, 0.4):
+        try:
+            wait.until(EC.element_to_be_clickable(locator)).click()
+            return
+        except (StaleElementReferenceException, ElementClickInterceptedException):
+            time.sleep(delay)
+    wait.until(EC.element_to_be_clickable(locator)).click()
+
+def click_and_wait_for_log(browser, button_id, timeout=10):
+    """Click a candlestick-test button and wait until its handler logs a result."""
+    log_count = browser.execute_script("return " + LOG_COUNT_JS)
+    robust_click(browser, (By.ID, button_id), timeout)
+    wait_for_js(browser, f"{LOG_COUNT_JS} > {log_count}", timeout)
+
+# Console errors recorded by the capture script the driver installs on every
+# document (see conftest._CONSOLE_CAPTURE_JS); when keywords (arguments[0],
+# lower case) are given only messages containing one of them are returned.
+CONSOLE_ERRORS_JS = """
+    const keywords = arguments[0];
+    return (window.__capturedLogs || [])
+        .filter((entry) => entry.level === 'SEVERE')
+        .map((entry) => entry.message)
+        .filter((message) => !keywords || keywords.some((k) => message.toLowerCase().includes(k)));
+"""
+
+def captured_console_errors(browser, keywords=None):
+    """Console errors logged by the current page, filtered in-page by keyword."""
+    return browser.execute_script(CONSOLE_ERRORS_JS, keywords)
+
+# Total number of captured console errors plus, for each category in the
+# arguments[0] mapping of category -> substrings (case-sensitive), the
+# errors containing any of that category's substrings.
+CONSOLE_ERROR_SUMMARY_JS = """
+    const errors = (window.__capturedLogs || [])
+        .filter((entry) => entry.level === 'SEVERE')
+        .map((entry) => entry.message);
+    return {
+        total: errors.length,
+        matches: Object.fromEntries(Object.entries(arguments[0]).map(([category, needles]) => [
+            category, errors.filter((error) => needles.some((needle) => error.includes(needle)))
+        ]))
+    };
+"""
+
+def console_error_summary(browser, categories):
+    """Count captured console errors and return only those matching each category."""
+    return browser.execute_script(CONSOLE_ERROR_SUMMARY_JS, categories)
+
+# True once the dashboard has painted its first frame with data, false if
+# initialisation failed, undefined while it is still starting up
+CHART_READY_JS = "document.readyState === 'complete' && window.__chartReady !== undefined"
+
+def wait_for_chart_ready(browser, timeout=15):
+    """Wait for the chart dashboard to finish initialising; return whether it succeeded."""
+    wait_for_js(browser, CHART_READY_JS, timeout)
+    return browser.execute_script("return window.__chartReady === true;")
+
+# Candlestick-test buttons that bring the chart to a fully set-up state
+CHART_SETUP_STEPS = ("init-chart", "load-data", "add-indicators")
+
+# Clicks each button id in arguments[0] in order, waiting (up to arguments[1]
+# ms per step) for its handler to append to #logs; calls back 'ok' or 'err:...'.
+CHART_SETUP_JS = """
+    const [buttonIds, timeoutMs, done] = arguments;
+    const logCount = () => document.querySelectorAll('#logs div').length;
+    const step = (id) => new Promise((resolve, reject) => {
+        const button = document.getElementById(id);
+        if (!button) {
+            reject(new Error('missing #' + id));
+            return;
+        }
+        const before = logCount();
+        const observer = new MutationObserver(() => {
+            if (logCount() > before) {
+                clearTimeout(timer);
+                observer.disconnect();
+                resolve();
+            }
+        });
+        const timer = setTimeout(() => {
+            observer.disconnect();
+            reject(new Error('no log output from #' + id));
+        }, timeoutMs);
+        observer.observe(document.getElementById('logs') || document.body, {childList: true, subtree: true});
+        button.click();
+    });
+    buttonIds.reduce((chain, id) => chain.then(() => step(id)), Promise.resolve())
+        .then(() => done('ok'))
+        .catch((e) => done('err:' + e.message));
+"""
+
+def setup_candlestick_chart(browser, timeout=10):
+    """Initialise the chart, load data and add indicators in one script call."""
+    WebDriverWait(browser, timeout).until(
+        EC.element_to_be_clickable((By.ID, CHART_SETUP_STEPS[0]))
+    )
+    browser.set_script_timeout(timeout * len(CHART_SETUP_STEPS) + 5)
+    result = browser.execute_async_script(CHART_SETUP_JS, list(CHART_SETUP_STEPS), timeout * 1000)
+    assert result == "ok", f"Chart setup failed: {result}"
+
+@pytest.fixture(scope="class")
+def candlestick_setup():
+    """Driver whose page holds this class's set-up candlestick chart, if any."""
+    return {"driver": None}
+
+@pytest.fixture
+def candlestick_chart(request, browser, candlestick_setup, test_config):
+    """Browser on the candlestick-test page with the chart set up.
+    
+    The init/load/indicator sequence runs once per class; the page is handed
+    to the next candlestick test while every test in between passes.
+    """
+    url = f"{test_config['dashboard_url']}/candlestick-test"
+    if candlestick_setup["driver"] is not browser or browser.current_url != url:
+        candlestick_setup["driver"] = None
+        browser.get(url)
+        setup_candlestick_chart(browser)
+        candlestick_setup["driver"] = browser
+    
+    yield browser
+    
+    if candlestick_setup["driver"] is browser:
+        request.node.keep_browser_page = "candlestick_chart"
+
+@pytest.fixture
+def mutated_candlestick_chart(candlestick_chart, candlestick_setup):
+    """Candlestick chart for a test that changes the page; it is set up again afterwards."""
+    yield candlestick_chart
+    
+    candlestick_setup["driver"] = None
+
 @pytest.mark.selenium
 @pytest.mark.chart
 @pytest.mark.dev
 class TestTradingViewAPIFixes:
     """Development tests for TradingView v5.0.8 API fixes."""
     
+    @pytest.mark.no_render
     def test_chart_initialization_success(self, browser, test_config):
         """Test that chart initializes without 'failed to initialise dashboard' error."""
         # Navigate to main chart dashboard
@@ -36,165 +212,73 @@ class TestTradingViewAPIFixes:
         )
         
         # Check for initialization error message
-        try:
-            error_element = browser.find_element(By.XPATH, "//*[contains(text(), 'failed to initialise dashboard')]")
-            assert False, f"Dashboard initialization failed: {error_element.text}"
-        except:
-            # No error message found - this is good
-            pass
+        error_elements = browser.find_elements(By.XPATH, "//*[contains(text(), 'failed to initialise dashboard')]")
+        assert not error_elements, f"Dashboard initialization failed: {error_elements[0].text if error_elements else ''}"
         
         # Verify TradingView library loads
-        library_loaded = browser.execute_script("""
-            return typeof LightweightCharts !== 'undefined';
-        """)
+        library_loaded = browser.execute_script(LIBRARY_LOADED_JS)
         assert library_loaded, "TradingView library should be loaded"
         
         # Wait for chart to be created
         chart_created = WebDriverWait(browser, 30).until(
-            lambda driver: driver.execute_script("""
-                return document.querySelector('#trading-chart canvas') !== null;
-            """)
+            lambda driver: driver.execute_script(CHART_CANVAS_EXISTS_JS)
         )
         assert chart_created, "Chart canvas should be created"
     
-    def test_candlestick_series_creation(self, browser, test_config):
+    def test_candlestick_series_creation(self, candlestick_chart):
         """Test that candlestick series creates successfully with v5.0.8 API."""
-        # Navigate to candlestick test page
-        browser.get(f"{test_config['dashboard_url']}/candlestick-test")
-        
-        # Wait for page to load
-        WebDriverWait(browser, 10).until(
-            EC.presence_of_element_located((By.ID, "init-chart"))
-        )
-        
-        # Click initialize chart
-        init_button = browser.find_element(By.ID, "init-chart")
-        init_button.click()
-        
-        # Wait for chart creation
-        time.sleep(2)
+        browser = candlestick_chart
         
         # Check for success message
         success_found = WebDriverWait(browser, 10).until(
-            lambda driver: "Chart created successfully" in driver.page_source
+            EC.text_to_be_present_in_element(LOGS_PANEL, "Chart created successfully")
         )
         assert success_found, "Chart should be created successfully"
         
         # Verify no API errors
-        api_errors = browser.execute_script("""
-            const logs = Array.from(document.querySelectorAll('#logs div'));
-            return logs.filter(log => log.textContent.includes('is not a function')).length;
-        """)
+        api_errors = browser.execute_script(LOG_MATCH_COUNT_JS, ["is not a function"])
         assert api_errors == 0, "Should have no TradingView API errors"
     
-    def test_indicator_creation_fixed(self, browser, test_config):
+    def test_indicator_creation_fixed(self, candlestick_chart):
         """Test that SMA indicators create without 'addLineSeries is not a function' error."""
-        # Navigate to candlestick test page
-        browser.get(f"{test_config['dashboard_url']}/candlestick-test")
-        
-        # Initialize chart first
-        WebDriverWait(browser, 10).until(
-            EC.element_to_be_clickable((By.ID, "init-chart"))
-        ).click()
-        time.sleep(2)
-        
-        # Load candlestick data
-        WebDriverWait(browser, 10).until(
-            EC.element_to_be_clickable((By.ID, "load-data"))
-        ).click()
-        time.sleep(2)
-        
-        # Add indicators
-        WebDriverWait(browser, 10).until(
-            EC.element_to_be_clickable((By.ID, "add-indicators"))
-        ).click()
-        time.sleep(3)
+        browser = candlestick_chart
         
         # Check for indicator success
         indicator_success = WebDriverWait(browser, 10).until(
-            lambda driver: "SMA indicator added successfully" in driver.page_source
+            EC.text_to_be_present_in_element(LOGS_PANEL, "SMA indicator added successfully")
         )
         assert indicator_success, "SMA indicator should be added successfully"
         
         # Verify no addLineSeries errors
-        line_series_errors = browser.execute_script("""
-            const logs = Array.from(document.querySelectorAll('#logs div'));
-            return logs.filter(log => log.textContent.includes('addLineSeries')).length;
-        """)
+        line_series_errors = browser.execute_script(LOG_MATCH_COUNT_JS, ["addLineSeries"])
         assert line_series_errors == 0, "Should have no addLineSeries errors"
         
         # Check for signal markers success
         marker_success = WebDriverWait(browser, 5).until(
-            lambda driver: "Signal markers added successfully" in driver.page_source
+            EC.text_to_be_present_in_element(LOGS_PANEL, "Signal markers added successfully")
         )
         assert marker_success, "Signal markers should be added successfully"
     
-    def test_crosshair_functionality_fixed(self, browser, test_config):
+    def test_crosshair_functionality_fixed(self, mutated_candlestick_chart):
         """Test that crosshair events work without API errors."""
-        # Navigate to candlestick test page
-        browser.get(f"{test_config['dashboard_url']}/candlestick-test")
-        
-        # Run through the test sequence
-        WebDriverWait(browser, 10).until(
-            EC.element_to_be_clickable((By.ID, "init-chart"))
-        ).click()
-        time.sleep(2)
-        
-        WebDriverWait(browser, 10).until(
-            EC.element_to_be_clickable((By.ID, "load-data"))
-        ).click()
-        time.sleep(2)
-        
-        WebDriverWait(browser, 10).until(
-            EC.element_to_be_clickable((By.ID, "add-indicators"))
-        ).click()
-        time.sleep(2)
+        browser = mutated_candlestick_chart
         
         # Test crosshair
-        WebDriverWait(browser, 10).until(
-            EC.element_to_be_clickable((By.ID, "test-crosshair"))
-        ).click()
-        time.sleep(2)
+        click_and_wait_for_log(browser, "test-crosshair")
         
         # Check for crosshair success
         crosshair_success = WebDriverWait(browser, 10).until(
-            lambda driver: "Crosshair event handler set up successfully" in driver.page_source
+            EC.text_to_be_present_in_element(LOGS_PANEL, "Crosshair event handler set up successfully")
         )
         assert crosshair_success, "Crosshair should be set up successfully"
         
         # Verify no crosshair API errors
-        crosshair_errors = browser.execute_script("""
-            const logs = Array.from(document.querySelectorAll('#logs div'));
-            return logs.filter(log => 
-                log.textContent.includes('seriesPrices') || 
-                log.textContent.includes('seriesData')
-            ).length;
-        """)
+        crosshair_errors = browser.execute_script(LOG_MATCH_COUNT_JS, ["seriesPrices", "seriesData"])
         # Some crosshair logs are expected for debugging, but no errors
         print(f"Crosshair debug logs found: {crosshair_errors}")
     
     def test_minimal_chart_works(self, browser, test_config):
         """Test that minimal chart implementation works as baseline."""
-        # Enable comprehensive console error capture
-        browser.execute_script("""
-            window.capturedErrors = [];
-            window.capturedLogs = [];
-            
-            // Capture console errors
-            const originalError = console.error;
-            console.error = function(...args) {
-                window.capturedErrors.push(args.join(' '));
-                originalError.apply(console, args);
-            };
-            
-            // Capture console logs for analysis
-            const originalLog = console.log;
-            console.log = function(...args) {
-                window.capturedLogs.push(args.join(' '));
-                originalLog.apply(console, args);
-            };
-        """)
-        
         # Navigate to minimal chart test page
         browser.get(f"{test_config['dashboard_url']}/minimal-chart")
         
@@ -205,40 +289,34 @@ class TestTradingViewAPIFixes:
         
         # Wait for completion message
         completion_found = WebDriverWait(browser, 30).until(
-            lambda driver: "Chart initialization complete!" in driver.page_source
+            lambda driver: driver.execute_script(PAGE_TEXT_CONTAINS_JS, "Chart initialization complete!")
         )
         assert completion_found, "Minimal chart should initialize completely"
         
-        # Get all captured errors and logs
-        captured_errors = browser.execute_script("return window.capturedErrors || [];")
-        captured_logs = browser.execute_script("return window.capturedLogs || [];")
-        browser_logs = browser.get_log('browser')
-        
-        # Filter for TradingView API errors
-        tradingview_errors = []
-        for error in captured_errors:
-            if any(keyword in error.lower() for keyword in [
-                'assertion failed', 'addseries', 'candlestick', 'lightweightcharts',
-                'cannot read properties', 'typeerror', 'addlineseries'
-            ]):
-                tradingview_errors.append(f"Console Error: {error}")
-        
-        # Check browser logs for severe errors
-        for log in browser_logs:
-            if log['level'] == 'SEVERE' and 'favicon' not in log['message']:
-                if any(keyword in log['message'].lower() for keyword in [
-                    'assertion failed', 'addseries', 'candlestick', 'typeerror'
-                ]):
-                    tradingview_errors.append(f"Browser Log: {log['message']}")
+        # Get TradingView API errors from the console capture, filtered in-page
+        captured_errors = captured_console_errors(browser, list(TRADINGVIEW_CONSOLE_KEYWORDS))
+        tradingview_errors = [f"Console Error: {error}" for error in captured_errors]
+        
+        # Check browser logs for severe errors in a single pass
+        tradingview_errors.extend(
+            f"Browser Log: {log['message']}"
+            for log in browser.get_log('browser')
+            if log['level'] == 'SEVERE'
+            and 'favicon' not in log['message']
+            and TRADINGVIEW_BROWSER_LOG_PATTERN.search(log['message'])
+        )
         
         # Check for chart content (should have canvas)
         canvas_elements = browser.find_elements(By.CSS_SELECTOR, "#chart canvas")
         if not canvas_elements:
             tradingview_errors.append("No chart canvas found - chart failed to initialize")
         
-        # Verify no CSS error elements
-        error_elements = browser.find_elements(By.CSS_SELECTOR, ".error")
-        css_error_count = len([el for el in error_elements if el.is_displayed()])
+        # Verify no visible CSS error elements (visibility checked in-page)
+        css_error_count = browser.execute_script("""
+            return Array.from(document.querySelectorAll('.error'))
+                .filter((el) => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden')
+                .length;
+        """)
         if css_error_count > 0:
             tradingview_errors.append(f"Found {css_error_count} CSS error elements")
         
@@ -265,33 +343,25 @@ class TestTradingViewAPIFixes:
 class TestTradingViewDebugging:
     """Debug tests for TradingView integration issues."""
     
+    @pytest.mark.no_render
     def test_capture_console_errors(self, browser, test_config):
         """Capture and analyze JavaScript console errors."""
-        # Enable console logging
-        browser.execute_script("""
-            window.consoleErrors = [];
-            const originalError = console.error;
-            console.error = function(...args) {
-                window.consoleErrors.push(args.join(' '));
-                originalError.apply(console, args);
-            };
-        """)
-        
         # Navigate to main chart
         browser.get(f"{test_config['dashboard_url']}/chart")
         
-        # Wait for page to load
-        time.sleep(10)
-        
-        # Get console errors
-        console_errors = browser.execute_script("return window.consoleErrors || [];")
+        # Wait for the dashboard to finish initialising
+        wait_for_chart_ready(browser)
         
-        # Analyze errors
-        tradingview_errors = [err for err in console_errors if 'LightweightCharts' in err or 'addLineSeries' in err]
-        module_errors = [err for err in console_errors if 'Failed to load module' in err]
+        # Analyze console errors in-page; only matching messages are returned
+        summary = console_error_summary(browser, {
+            "tradingview": ["LightweightCharts", "addLineSeries"],
+            "module": ["Failed to load module"],
+        })
+        tradingview_errors = summary["matches"]["tradingview"]
+        module_errors = summary["matches"]["module"]
         
         # Report findings
-        print(f"Total console errors: {len(console_errors)}")
+        print(f"Total console errors: {summary['total']}")
         print(f"TradingView specific errors: {len(tradingview_errors)}")
         print(f"Module loading errors: {len(module_errors)}")
         
@@ -309,6 +379,7 @@ class TestTradingViewDebugging:
         critical_errors = tradingview_errors + module_errors
         assert len(critical_errors) == 0, f"Found {len(critical_errors)} critical errors"
     
+    @pytest.mark.no_render
     def test_api_endpoints_accessibility(self, browser, test_config):
         """Test that all required API endpoints are accessible."""
         endpoints_to_test = [
@@ -318,28 +389,24 @@ class TestTradingViewDebugging:
             "/api/logs?lines=10"
         ]
         
-        for endpoint in endpoints_to_test:
-            # Test endpoint accessibility via JavaScript
-            response_status = browser.execute_script(f"""
-                return fetch('{test_config['dashboard_url']}{endpoint}')
-                    .then(response => response.status)
-                    .catch(error => 0);
-            """)
-            
-            # Wait for promise to resolve
-            time.sleep(1)
-            
-            # Check response
-            final_status = browser.execute_script("return arguments[0];", response_status)
-            assert final_status == 200, f"Endpoint {endpoint} should be accessible (got {final_status})"
+        # Fetch all endpoints concurrently in a single async script call
+        statuses = browser.execute_async_script("""
+            const [urls, done] = arguments;
+            Promise.all(urls.map((url) => fetch(url).then((response) => response.status).catch(() => 0)))
+                .then(done);
+        """, [f"{test_config['dashboard_url']}{endpoint}" for endpoint in endpoints_to_test])
+        
+        for endpoint, status in zip(endpoints_to_test, statuses):
+            assert status == 200, f"Endpoint {endpoint} should be accessible (got {status})"
     
+    @pytest.mark.no_render
     def test_javascript_module_loading(self, browser, test_config):
         """Test that all JavaScript modules load correctly."""
         # Navigate to chart page
         browser.get(f"{test_config['dashboard_url']}/chart")
         
         # Wait for modules to load
-        time.sleep(5)
+        wait_for_chart_ready(browser)
         
         # Check module availability
         modules_loaded = browser.execute_script("""
@@ -362,7 +429,7 @@ class TestTradingViewDebugging:
         print(f"Module loading status: {json.dumps(modules_loaded, indent=2)}")
         
         # At minimum, TradingView library should be loaded
-        tradingview_loaded = browser.execute_script("return typeof LightweightCharts !== 'undefined';")
+        tradingview_loaded = browser.execute_script(LIBRARY_LOADED_JS)
         assert tradingview_loaded, "TradingView library must be loaded"
 
 @pytest.mark.selenium
@@ -380,9 +447,7 @@ class TestTradingViewPerformance:
         
         # Wait for chart to be ready
         chart_ready = WebDriverWait(browser, 30).until(
-            lambda driver: driver.execute_script("""
-                return document.querySelector('#trading-chart canvas') !== null;
-            """)
+            lambda driver: driver.execute_script(CHART_CANVAS_EXISTS_JS)
         )
         
         load_time = time.time() - start_time
@@ -398,7 +463,10 @@ class TestTradingViewPerformance:
         browser.get(f"{test_config['dashboard_url']}/chart")
         
         # Wait for chart to load
-        time.sleep(10)
+        assert wait_for_chart_ready(browser), "Chart should initialise"
+        
+        # Collect garbage first so only live heap is measured
+        browser.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
         
         # Get memory usage if available
         memory_info = browser.execute_script("""
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from strategies.swing_range_expansion.strategy import SwingRangeExpansionStrategy
 from strategies.swing_range_expansion.config import SwingRangeConfig
@@ -5,11 +6,24 @@ from strategies.swing_range_expansion.config import SwingRangeConfig
 
 def test_nr7_and_trade_generation():
     # Fabricate deterministic bars where day 6 is NR7 and breakout next day
-    highs = [110, 115, 120, 125, 130, 131, 140, 150, 160, 170]
-    lows = [100, 105, 110, 115, 120, 121, 130, 140, 150, 160]
-    closes = [105, 110, 115, 120, 125, 126, 135, 145, 155, 165]
-    df = pd.DataFrame({"high": highs, "low": lows, "close": closes})
-    df["date"] = pd.RangeIndex(len(df))
+    # Columns: high, low, close
+    bars = np.array(
+        [
+            [110, 100, 105],
+            [115, 105, 110],
+            [120, 110, 115],
+            [125, 115, 120],
+            [130, 120, 125],
+            [131, 121, 126],
+            [140, 130, 135],
+            [150, 140, 145],
+            [160, 150, 155],
+            [170, 160, 165],
+        ],
+        dtype=np.float64,
+    )
+    # No "date" column: generate_trades fills in the positional one itself
+    df = pd.DataFrame(bars, columns=["high", "low", "close"])
 
     cfg = SwingRangeConfig(nr_lookback=7, max_bars_in_trade=2)
     strat = SwingRangeExpansionStrategy(cfg)
@@ -1,11 +1,19 @@
+import pytest
+
 from strategies.swing_range_expansion.runner.backtest_runner import (
     SwingRangeExpansionBacktestRunner,
 )
 
 
-def test_runner_returns_metrics():
-    runner = SwingRangeExpansionBacktestRunner()
-    result = runner.run("AAA.FUT.NSE")
+@pytest.fixture(scope="module")
+def runner():
+    """Runner shared by every test in the module; run() takes the symbol."""
+    return SwingRangeExpansionBacktestRunner()
+
+
+@pytest.mark.parametrize("instrument_id", ["AAA.FUT.NSE"])
+def test_runner_returns_metrics(runner, instrument_id):
+    result = runner.run(instrument_id)
 
     assert "pnl" in result
     assert "mdd_pct" in result or "max_drawdown_pct" in result
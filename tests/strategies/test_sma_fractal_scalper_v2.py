@@ -4,131 +4,188 @@ This test suite validates the new pluggable indicator and signal generation
 architecture, ensuring all components work together correctly.
 """
 
+import copy
 import pytest
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, List
-import tempfile
-import os
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 from src.strategies.sma_fractal_scalper_v2.strategy import SmaFractalScalperV2
 from src.strategies.sma_fractal_scalper_v2.config import SmaFractalScalperV2Config
 from utils.indicators.manager import IndicatorManager
 from utils.indicators.base import IndicatorConfig
+from utils.indicators.implementations import BollingerBandsIndicator, RSIIndicator, SMAIndicator
 from utils.signals.manager import SignalManager
 from utils.signals.base import SignalConfig, SignalType
 
+# Fixed start time keeps the generated bars deterministic between runs
+BASE_TIMESTAMP = pd.Timestamp('2024-01-01 09:15:00')
 
-@pytest.fixture
-def temp_config_files():
-    """Create temporary configuration files for testing."""
-    temp_dir = tempfile.mkdtemp()
-    
-    # Create indicators config
-    indicators_config = {
-        'indicators': {
-            'sma_short': {
-                'type': 'sma',
-                'enabled': True,
-                'visible_on_chart': True,
-                'parameters': {'period': 5},
-                'chart_settings': {'color': '#FF6B6B'}
-            },
-            'sma_long': {
-                'type': 'sma',
-                'enabled': True,
-                'visible_on_chart': True,
-                'parameters': {'period': 20},  # Shorter for testing
-                'chart_settings': {'color': '#4ECDC4'}
-            },
-            'fractal': {
-                'type': 'fractal',
-                'enabled': True,
-                'visible_on_chart': True,
-                'parameters': {'window': 5},
-                'chart_settings': {'color': '#45B7D1'}
-            }
+# Indicator and signal configs, passed in directly or via temporary YAML files
+INDICATORS_CONFIG = {
+    'indicators': {
+        'sma_short': {
+            'type': 'sma',
+            'enabled': True,
+            'visible_on_chart': True,
+            'parameters': {'period': 5},
+            'chart_settings': {'color': '#FF6B6B'}
+        },
+        'sma_long': {
+            'type': 'sma',
+            'enabled': True,
+            'visible_on_chart': True,
+            'parameters': {'period': 20},  # Shorter for testing
+            'chart_settings': {'color': '#4ECDC4'}
+        },
+        'fractal': {
+            'type': 'fractal',
+            'enabled': True,
+            'visible_on_chart': True,
+            'parameters': {'window': 5},
+            'chart_settings': {'color': '#45B7D1'}
         }
     }
-    
-    # Create signals config
-    signals_config = {
-        'signals': {
-            'primary_signal': {
-                'type': 'sma_fractal',
-                'enabled': True,
-                'required_indicators': ['sma_short', 'sma_long', 'fractal'],
-                'parameters': {
-                    'sma_short_period': 5,
-                    'sma_long_period': 20,
-                    'fractal_window': 5
-                },
-                'confidence_threshold': 0.6
-            }
-        },
-        'signal_combination': {
-            'mode': 'primary_only',
-            'primary_signal': 'primary_signal'
+}
+
+SIGNALS_CONFIG = {
+    'signals': {
+        'primary_signal': {
+            'type': 'sma_fractal',
+            'enabled': True,
+            'required_indicators': ['sma_short', 'sma_long', 'fractal'],
+            'parameters': {
+                'sma_short_period': 5,
+                'sma_long_period': 20,
+                'fractal_window': 5
+            },
+            'confidence_threshold': 0.6
         }
+    },
+    'signal_combination': {
+        'mode': 'primary_only',
+        'primary_signal': 'primary_signal'
     }
+}
+
+# Serialized once at import; the fixture only writes the bytes
+_INDICATORS_YAML = yaml.dump(INDICATORS_CONFIG, Dumper=SafeDumper).encode()
+_SIGNALS_YAML = yaml.dump(SIGNALS_CONFIG, Dumper=SafeDumper).encode()
+
+
+@pytest.fixture(scope="session")
+def temp_config_files(tmp_path_factory):
+    """Create temporary configuration files for testing.
     
-    # Write config files
-    indicators_path = os.path.join(temp_dir, 'indicators.yaml')
-    signals_path = os.path.join(temp_dir, 'signals.yaml')
+    The files are only read by the tests, so they are written once per
+    session into a pytest-managed temporary directory.
+    """
+    temp_dir = tmp_path_factory.mktemp("v2_config")
     
-    with open(indicators_path, 'w') as f:
-        yaml.dump(indicators_config, f)
+    # Write config files
+    indicators_path = temp_dir / 'indicators.yaml'
+    signals_path = temp_dir / 'signals.yaml'
     
-    with open(signals_path, 'w') as f:
-        yaml.dump(signals_config, f)
+    indicators_path.write_bytes(_INDICATORS_YAML)
+    signals_path.write_bytes(_SIGNALS_YAML)
     
     return {
-        'temp_dir': temp_dir,
-        'indicators_path': indicators_path,
-        'signals_path': signals_path
+        'temp_dir': str(temp_dir),
+        'indicators_path': str(indicators_path),
+        'signals_path': str(signals_path)
     }
 
 
-@pytest.fixture
-def sample_market_data():
-    """Generate sample market data for testing."""
-    data = []
+@pytest.fixture(scope="session")
+def sample_market_frame():
+    """Generate sample market data for testing as an OHLCV DataFrame."""
     base_price = 1000.0
     
     # Generate 50 bars of sample data with a trend
-    for i in range(50):
-        timestamp = pd.Timestamp.now() + pd.Timedelta(minutes=i)
-        
-        # Create an uptrend
-        price = base_price + (i * 0.5) + (i % 5) * 0.2  # Small fluctuations
-        
-        bar = {
-            'timestamp': timestamp,
-            'open': price - 0.1,
-            'high': price + 0.2,
-            'low': price - 0.2,
-            'close': price,
-            'volume': 1000 + (i * 10)
-        }
-        data.append(bar)
+    i = np.arange(50)
+    
+    # Create an uptrend
+    price = base_price + (i * 0.5) + (i % 5) * 0.2  # Small fluctuations
+    
+    return pd.DataFrame({
+        'timestamp': pd.date_range(BASE_TIMESTAMP, periods=len(i), freq='1min'),
+        'open': price - 0.1,
+        'high': price + 0.2,
+        'low': price - 0.2,
+        'close': price,
+        'volume': 1000 + (i * 10)
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_market_data(sample_market_frame):
+    """Sample market data as bar dicts.
+    
+    Shared by the whole session, so it is handed out as a tuple.
+    """
+    return tuple(sample_market_frame.to_dict('records'))
+
+
+@pytest.fixture(scope="session")
+def v2_config():
+    """Strategy config built from the in-memory indicator/signal configs."""
+    return SmaFractalScalperV2Config(
+        indicators_config=INDICATORS_CONFIG,
+        signals_config=SIGNALS_CONFIG
+    )
+
+
+@pytest.fixture(scope="session")
+def base_strategy(v2_config):
+    """Build the strategy once per session (per worker under xdist).
+    
+    Tests reach it through the ``strategy`` fixture, which resets it and
+    restores any disabled components, so it is safe to share.
+    """
+    return SmaFractalScalperV2(v2_config)
+
+
+@pytest.fixture
+def strategy(base_strategy):
+    """Hand out the shared strategy in a freshly reset state.
+    
+    Indicators and signal generators disabled by a test are re-enabled on
+    teardown so the next test sees the configured set again.
+    """
+    enabled_indicators = base_strategy.indicator_manager.list_enabled_indicators()
+    enabled_generators = base_strategy.signal_manager.list_enabled_signal_generators()
+    
+    base_strategy.reset()
+    yield base_strategy
+    
+    for name in enabled_indicators:
+        base_strategy.enable_indicator(name)
+    for name in enabled_generators:
+        base_strategy.enable_signal_generator(name)
+
+
+@pytest.fixture(scope="session")
+def warmed_strategy(v2_config, sample_market_frame):
+    """Build and warm up a strategy once per session.
     
-    return data
+    Treat it as read-only; tests that mutate it work on a deep copy.
+    """
+    strategy = SmaFractalScalperV2(v2_config)
+    strategy.warmup_indicators(sample_market_frame)
+    return strategy
 
 
 class TestSmaFractalScalperV2:
     """Test suite for SMA Fractal Scalper V2 strategy."""
     
-    @pytest.fixture
-    def sample_config(self):
-        """Create a sample configuration for testing."""
-        return SmaFractalScalperV2Config(
-            risk_per_trade=0.02,
-            timeframe='1MIN',
-            historical_warmup=True
-        )
-    
     def test_strategy_initialization(self, temp_config_files):
-        """Test strategy initialization with pluggable architecture."""
+        """Test strategy initialization from the YAML config files."""
         config = SmaFractalScalperV2Config(
             indicators_config_path=temp_config_files['indicators_path'],
             signals_config_path=temp_config_files['signals_path']
@@ -151,29 +208,16 @@ class TestSmaFractalScalperV2:
         signal_names = strategy.signal_manager.list_signal_generators()
         assert 'primary_signal' in signal_names
     
-    def test_warmup_requirements(self, temp_config_files):
+    def test_warmup_requirements(self, strategy):
         """Test warmup requirements calculation."""
-        config = SmaFractalScalperV2Config(
-            indicators_config_path=temp_config_files['indicators_path'],
-            signals_config_path=temp_config_files['signals_path']
-        )
-        
-        strategy = SmaFractalScalperV2(config)
         warmup_reqs = strategy.get_warmup_requirements()
         
         assert isinstance(warmup_reqs, dict)
         # Should have requirements for each indicator
         assert len(warmup_reqs) > 0
     
-    def test_indicator_warmup(self, temp_config_files, sample_market_data):
+    def test_indicator_warmup(self, strategy, sample_market_data):
         """Test indicator warmup with historical data."""
-        config = SmaFractalScalperV2Config(
-            indicators_config_path=temp_config_files['indicators_path'],
-            signals_config_path=temp_config_files['signals_path']
-        )
-        
-        strategy = SmaFractalScalperV2(config)
-        
         # Warm up with sample data
         strategy.warmup_indicators(sample_market_data)
         
@@ -187,68 +231,37 @@ class TestSmaFractalScalperV2:
             # Some indicators may not have values immediately, so we just check structure
             assert indicator_name in strategy.indicator_manager.list_indicators()
     
-    def test_signal_generation(self, temp_config_files, sample_market_data):
+    def test_signal_generation(self, strategy, sample_market_data):
         """Test signal generation from indicators."""
-        config = SmaFractalScalperV2Config(
-            indicators_config_path=temp_config_files['indicators_path'],
-            signals_config_path=temp_config_files['signals_path']
-        )
-        
-        strategy = SmaFractalScalperV2(config)
-        
         # Warm up with initial data
         strategy.warmup_indicators(sample_market_data[:-5])
         
         # Process remaining bars and look for signals
-        signals_generated = []
-        for bar in sample_market_data[-5:]:
-            signal = strategy.on_bar(bar)
-            if signal:
-                signals_generated.append(signal)
+        signals_generated = [
+            signal for signal in map(strategy.on_bar, sample_market_data[-5:]) if signal
+        ]
         
         # Signal generation should work without errors
         assert isinstance(signals_generated, list)
     
-    def test_indicator_management(self, temp_config_files):
-        """Test dynamic indicator management."""
-        config = SmaFractalScalperV2Config(
-            indicators_config_path=temp_config_files['indicators_path'],
-            signals_config_path=temp_config_files['signals_path']
-        )
-        
-        strategy = SmaFractalScalperV2(config)
-        
-        # Test enabling/disabling indicators
-        assert strategy.disable_indicator('sma_short')
-        assert strategy.enable_indicator('sma_short')
-        
-        # Test invalid indicator name
-        assert not strategy.enable_indicator('nonexistent_indicator')
-    
-    def test_signal_management(self, temp_config_files):
-        """Test dynamic signal generator management."""
-        config = SmaFractalScalperV2Config(
-            indicators_config_path=temp_config_files['indicators_path'],
-            signals_config_path=temp_config_files['signals_path']
-        )
-        
-        strategy = SmaFractalScalperV2(config)
-        
-        # Test enabling/disabling signal generators
-        assert strategy.disable_signal_generator('primary_signal')
-        assert strategy.enable_signal_generator('primary_signal')
-        
-        # Test invalid signal generator name
-        assert not strategy.enable_signal_generator('nonexistent_signal')
+    @pytest.mark.parametrize("kind,name", [
+        ("indicator", "sma_short"),
+        ("signal_generator", "primary_signal"),
+    ])
+    def test_component_management(self, strategy, kind, name):
+        """Test dynamic indicator and signal generator management."""
+        enable = getattr(strategy, f"enable_{kind}")
+        disable = getattr(strategy, f"disable_{kind}")
+        
+        # Test enabling/disabling the component
+        assert disable(name)
+        assert enable(name)
+        
+        # Test invalid component name
+        assert not enable(f"nonexistent_{kind}")
     
-    def test_chart_configuration(self, temp_config_files):
+    def test_chart_configuration(self, strategy):
         """Test chart configuration generation."""
-        config = SmaFractalScalperV2Config(
-            indicators_config_path=temp_config_files['indicators_path'],
-            signals_config_path=temp_config_files['signals_path']
-        )
-        
-        strategy = SmaFractalScalperV2(config)
         chart_config = strategy.get_chart_config()
         
         assert 'indicators' in chart_config
@@ -258,17 +271,10 @@ class TestSmaFractalScalperV2:
         indicator_configs = chart_config['indicators']
         assert isinstance(indicator_configs, list)
     
-    def test_strategy_status(self, temp_config_files, sample_market_data):
+    def test_strategy_status(self, warmed_strategy):
         """Test comprehensive strategy status reporting."""
-        config = SmaFractalScalperV2Config(
-            indicators_config_path=temp_config_files['indicators_path'],
-            signals_config_path=temp_config_files['signals_path']
-        )
-        
-        strategy = SmaFractalScalperV2(config)
-        strategy.warmup_indicators(sample_market_data)
-        
-        status = strategy.get_status()
+        # get_status() is read-only, so the shared warmed instance is used as is
+        status = warmed_strategy.get_status()
         
         assert 'strategy_name' in status
         assert 'warmup_complete' in status
@@ -278,15 +284,8 @@ class TestSmaFractalScalperV2:
         # Check that strategy is initialized after warmup
         assert status['warmup_complete'] is True
     
-    def test_configuration_export(self, temp_config_files):
+    def test_configuration_export(self, strategy):
         """Test configuration export functionality."""
-        config = SmaFractalScalperV2Config(
-            indicators_config_path=temp_config_files['indicators_path'],
-            signals_config_path=temp_config_files['signals_path']
-        )
-        
-        strategy = SmaFractalScalperV2(config)
-        
         # Export configurations
         exported_config = strategy.export_configuration()
         
@@ -295,15 +294,9 @@ class TestSmaFractalScalperV2:
         assert 'indicators_config' in exported_config
         assert 'signals_config' in exported_config
     
-    def test_strategy_reset(self, temp_config_files, sample_market_data):
+    def test_strategy_reset(self, warmed_strategy):
         """Test strategy reset functionality."""
-        config = SmaFractalScalperV2Config(
-            indicators_config_path=temp_config_files['indicators_path'],
-            signals_config_path=temp_config_files['signals_path']
-        )
-        
-        strategy = SmaFractalScalperV2(config)
-        strategy.warmup_indicators(sample_market_data)
+        strategy = copy.deepcopy(warmed_strategy)
         
         # Verify strategy is ready
         assert strategy.warmup_complete
@@ -313,6 +306,28 @@ class TestSmaFractalScalperV2:
         
         # Verify strategy is reset
         assert not strategy.warmup_complete
+    
+    def test_strategy_reset_clears_trade_state(self, strategy):
+        """Test reset clears position, trade and EOD order state."""
+        strategy.position = "LONG"
+        strategy.trades.append({'pnl': 1.0})
+        strategy._entry_price = 100.0
+        strategy._stop_price = 99.0
+        strategy._entry_ts = 1700000000
+        strategy._new_positions_blocked = True
+        strategy._eod_order_placed = True
+        strategy._eod_order_id = "EOD_TEST"
+        
+        strategy.reset()
+        
+        assert strategy.position is None
+        assert strategy.trades == []
+        assert strategy._entry_price is None
+        assert strategy._stop_price is None
+        assert strategy._entry_ts is None
+        assert not strategy._new_positions_blocked
+        assert not strategy._eod_order_placed
+        assert strategy._eod_order_id is None
 
 
 class TestIndicatorManager:
@@ -335,7 +350,7 @@ class TestIndicatorManager:
         
         # Update with sample data
         sample_bar = {
-            'timestamp': pd.Timestamp.now(),
+            'timestamp': BASE_TIMESTAMP,
             'open': 100.0,
             'high': 101.0,
             'low': 99.0,
@@ -348,6 +363,80 @@ class TestIndicatorManager:
         # Check that indicators were updated by getting current values
         current_values = manager.get_current_values()
         assert len(current_values) > 0
+    
+    def test_frame_warmup_matches_bar_updates(self, sample_market_frame, sample_market_data):
+        """Test bulk warmup from a DataFrame matches bar-by-bar updates."""
+        bar_manager = IndicatorManager()
+        bar_manager.load_from_dict(INDICATORS_CONFIG)
+        for bar in sample_market_data:
+            bar_manager.update_all(bar)
+        
+        frame_manager = IndicatorManager()
+        frame_manager.load_from_dict(INDICATORS_CONFIG)
+        frame_manager.warmup_from_frame(sample_market_frame)
+        
+        for name in bar_manager.list_indicators():
+            expected = bar_manager.get_indicator(name).get_historical_values(lookback=100)
+            actual = frame_manager.get_indicator(name).get_historical_values(lookback=100)
+            
+            assert [v.timestamp for v in actual] == [v.timestamp for v in expected]
+            for actual_value, expected_value in zip(actual, expected):
+                assert actual_value.values == pytest.approx(expected_value.values)
+    
+    def test_rolling_window_indicators(self):
+        """Test incremental SMA/Bollinger values across warmup, buffer wraps and reset."""
+        period = 20
+        closes = 100.0 + np.cumsum(np.random.default_rng(7).normal(0, 0.5, 300))
+        frame = pd.DataFrame({
+            'timestamp': pd.date_range(BASE_TIMESTAMP, periods=len(closes), freq='1min'),
+            'open': closes, 'high': closes + 0.5, 'low': closes - 0.5, 'close': closes, 'volume': 1000.0
+        })
+        bars = frame.to_dict('records')
+        sma = SMAIndicator(IndicatorConfig("sma", "sma", parameters={"period": period, "buffer_size": 50}))
+        bands = BollingerBandsIndicator(IndicatorConfig("bb", "bollinger", parameters={"period": period, "buffer_size": 50}))
+        
+        sma.warmup_from_frame(frame.iloc[:100])
+        sma_seen = list(closes[:100])
+        band_seen = []
+        
+        for i, bar in enumerate(bars[100:], start=100):
+            if i == 200:
+                # SMA re-warms from older bars after a reset, Bollinger starts over
+                sma.reset()
+                sma.warmup_from_frame(frame.iloc[50:90])
+                sma_seen = list(closes[50:90])
+                bands.reset()
+                band_seen = []
+            sma_seen.append(bar['close'])
+            band_seen.append(bar['close'])
+            
+            sma_window = np.array(sma_seen[-period:])
+            assert sma.update(bar).values["value"] == pytest.approx(sma_window.mean())
+            
+            band_value = bands.update(bar)
+            if len(band_seen) < period:
+                assert band_value is None
+            else:
+                band_window = np.array(band_seen[-period:])
+                assert band_value.values["upper_band"] == pytest.approx(band_window.mean() + 2.0 * band_window.std())
+    
+    def test_rsi_uses_wilder_smoothing(self):
+        """Test RSI seeds with simple averages, then applies Wilder's smoothing."""
+        period = 14
+        closes = 100.0 + np.cumsum(np.random.default_rng(3).normal(0, 0.5, 200))
+        rsi = RSIIndicator(IndicatorConfig("rsi", "rsi", parameters={"period": period, "buffer_size": 30}))
+        values = [value.values["value"] for value in map(rsi.update, ({'close': c} for c in closes)) if value]
+        
+        changes = np.diff(closes)
+        gains, losses = np.maximum(changes, 0), np.maximum(-changes, 0)
+        avg_gain, avg_loss = gains[:period].mean(), losses[:period].mean()
+        expected = [100.0 - 100.0 / (1.0 + avg_gain / avg_loss)]
+        for gain, loss in zip(gains[period:], losses[period:]):
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+            expected.append(100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+        
+        assert values == pytest.approx(expected)
 
 
 class TestSignalManager:
@@ -371,26 +460,51 @@ class TestSignalManager:
         
         indicator_values = {
             'sma_short': IndicatorValue(
-                timestamp=pd.Timestamp.now(),
+                timestamp=BASE_TIMESTAMP,
                 values={'value': 105.0}
             ),
             'sma_long': IndicatorValue(
-                timestamp=pd.Timestamp.now(),
+                timestamp=BASE_TIMESTAMP,
                 values={'value': 100.0}
             ),
             'fractal': IndicatorValue(
-                timestamp=pd.Timestamp.now(),
+                timestamp=BASE_TIMESTAMP,
                 values={'fractal_high': 0, 'fractal_low': 99.0}
             )
         }
         
         market_data = {
-            'timestamp': pd.Timestamp.now(),
+            'timestamp': BASE_TIMESTAMP,
             'close': 104.0
         }
         
         signals = manager.generate_signals(indicator_values, market_data)
         assert isinstance(signals, dict)
+    
+    def test_cached_signal_generation(self):
+        """Test repeated inputs reuse the last result until generators change."""
+        manager = SignalManager(cache_last_result=True)
+        manager.load_from_dict(SIGNALS_CONFIG)
+        generator = manager.get_signal_generator('primary_signal')
+        
+        calls = []
+        original = generator.generate_signal
+        generator.generate_signal = lambda *args: calls.append(args) or original(*args)
+        
+        indicator_values = {}
+        market_data = {'timestamp': BASE_TIMESTAMP, 'close': 104.0}
+        
+        first = manager.generate_signals(indicator_values, market_data)
+        assert manager.generate_signals(indicator_values, market_data) == first
+        assert len(calls) == 1
+        
+        # A new bar or a generator change invalidates the cached result
+        next_bar = {**market_data, 'timestamp': BASE_TIMESTAMP + pd.Timedelta(minutes=1)}
+        manager.generate_signals(indicator_values, next_bar)
+        assert len(calls) == 2
+        manager.enable_signal_generator('primary_signal')
+        manager.generate_signals(indicator_values, next_bar)
+        assert len(calls) == 3
 
 
 if __name__ == "__main__":
@@ -4,13 +4,17 @@ This test suite ensures that the new pluggable architecture (V2) produces
 identical results to the original strategy (V1) under various scenarios.
 """
 
+import copy
 import pytest
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, List, Optional
-import tempfile
-import os
 import yaml
-from unittest.mock import MagicMock
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
 
 from src.strategies.sma_fractal_scalper.strategy import SmaFractalScalper
 from src.strategies.sma_fractal_scalper.config import SmaFractalScalperConfig
@@ -20,6 +24,8 @@ from src.strategies.sma_fractal_scalper_v2.config import SmaFractalScalperV2Conf
 
 class MockBar:
     """Mock bar object for testing."""
+    __slots__ = ('open', 'high', 'low', 'close', 'volume', 'timestamp', '_as_dict')
+    
     def __init__(self, open_price, high, low, close, volume=1000, timestamp=None):
         self.open = open_price
         self.high = high
@@ -27,207 +33,219 @@ class MockBar:
         self.close = close
         self.volume = volume
         self.timestamp = timestamp or pd.Timestamp.now()
-
-
-@pytest.fixture
-def temp_v2_config_files():
-    """Create temporary V2 configuration files matching V1 parameters."""
-    temp_dir = tempfile.mkdtemp()
+        self._as_dict = None
     
-    # Create indicators config matching V1 defaults
-    indicators_config = {
-        'indicators': {
-            'sma_short': {
-                'type': 'sma',
-                'enabled': True,
-                'visible_on_chart': True,
-                'parameters': {'period': 5},
-                'chart_settings': {'color': '#FF6B6B'}
-            },
-            'sma_long': {
-                'type': 'sma',
-                'enabled': True,
-                'visible_on_chart': True,
-                'parameters': {'period': 200},
-                'chart_settings': {'color': '#4ECDC4'}
-            },
-            'fractal': {
-                'type': 'fractal',
-                'enabled': True,
-                'visible_on_chart': True,
-                'parameters': {'window': 5},
-                'chart_settings': {'color': '#45B7D1'}
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the bar as the dict V2 consumes (built once, treat as read-only)."""
+        if self._as_dict is None:
+            self._as_dict = {
+                'timestamp': self.timestamp,
+                'open': self.open,
+                'high': self.high,
+                'low': self.low,
+                'close': self.close,
+                'volume': self.volume
             }
+        return self._as_dict
+
+
+# V2 indicator config matching V1 defaults
+V2_INDICATORS_CONFIG = {
+    'indicators': {
+        'sma_short': {
+            'type': 'sma',
+            'enabled': True,
+            'visible_on_chart': True,
+            'parameters': {'period': 5},
+            'chart_settings': {'color': '#FF6B6B'}
+        },
+        'sma_long': {
+            'type': 'sma',
+            'enabled': True,
+            'visible_on_chart': True,
+            'parameters': {'period': 200},
+            'chart_settings': {'color': '#4ECDC4'}
+        },
+        'fractal': {
+            'type': 'fractal',
+            'enabled': True,
+            'visible_on_chart': True,
+            'parameters': {'window': 5},
+            'chart_settings': {'color': '#45B7D1'}
         }
     }
-    
-    # Create signals config matching V1 behavior
-    signals_config = {
-        'signals': {
-            'primary_signal': {
-                'type': 'sma_fractal',
-                'enabled': True,
-                'required_indicators': ['sma_short', 'sma_long', 'fractal'],
-                'parameters': {
-                    'sma_short_period': 5,
-                    'sma_long_period': 200,
-                    'fractal_window': 5,
-                    'use_sma': True,
-                    'use_fractals': True
-                },
-                'confidence_threshold': 0.6
-            }
-        },
-        'signal_combination': {
-            'mode': 'primary_only',
-            'primary_signal': 'primary_signal'
+}
+
+# V2 signal config matching V1 behavior
+V2_SIGNALS_CONFIG = {
+    'signals': {
+        'primary_signal': {
+            'type': 'sma_fractal',
+            'enabled': True,
+            'required_indicators': ['sma_short', 'sma_long', 'fractal'],
+            'parameters': {
+                'sma_short_period': 5,
+                'sma_long_period': 200,
+                'fractal_window': 5,
+                'use_sma': True,
+                'use_fractals': True
+            },
+            'confidence_threshold': 0.6
         }
+    },
+    'signal_combination': {
+        'mode': 'primary_only',
+        'primary_signal': 'primary_signal'
     }
+}
+
+
+@pytest.fixture(scope="session")
+def temp_v2_config_files(tmp_path_factory):
+    """Create temporary V2 configuration files matching V1 parameters.
     
-    # Write config files
-    indicators_path = os.path.join(temp_dir, 'indicators.yaml')
-    signals_path = os.path.join(temp_dir, 'signals.yaml')
+    The files are only read, so they are written once per session.
+    """
+    temp_dir = tmp_path_factory.mktemp("v1_v2_config")
     
-    with open(indicators_path, 'w') as f:
-        yaml.dump(indicators_config, f)
+    # Write config files
+    indicators_path = temp_dir / 'indicators.yaml'
+    signals_path = temp_dir / 'signals.yaml'
     
-    with open(signals_path, 'w') as f:
-        yaml.dump(signals_config, f)
+    indicators_path.write_text(yaml.dump(V2_INDICATORS_CONFIG, Dumper=SafeDumper))
+    signals_path.write_text(yaml.dump(V2_SIGNALS_CONFIG, Dumper=SafeDumper))
     
     return {
-        'temp_dir': temp_dir,
-        'indicators_path': indicators_path,
-        'signals_path': signals_path
+        'temp_dir': str(temp_dir),
+        'indicators_path': str(indicators_path),
+        'signals_path': str(signals_path)
     }
 
 
-@pytest.fixture
+def _bars_from_closes(close, open_offset, range_width, timestamps):
+    """Build MockBars around a close-price series."""
+    return [
+        MockBar(open_price=o, high=h, low=l, close=c, timestamp=ts)
+        for o, h, l, c, ts in zip(
+            (close + open_offset).tolist(),
+            (close + range_width).tolist(),
+            (close - range_width).tolist(),
+            close.tolist(),
+            timestamps
+        )
+    ]
+
+
+@pytest.fixture(scope="session")
 def test_scenarios():
     """Generate various test scenarios with different market conditions."""
     scenarios = {}
+    base_price = 1000.0
+    
+    i = np.arange(250)  # Need enough bars for 200-period SMA
+    timestamps = pd.date_range(start=pd.Timestamp.now(), periods=len(i), freq='1min')
     
     # Scenario 1: Simple uptrend with SMA crossover
-    uptrend_bars = []
-    base_price = 1000.0
-    for i in range(250):  # Need enough bars for 200-period SMA
-        price = base_price + (i * 0.1)  # Gradual uptrend
-        bar = MockBar(
-            open_price=price - 0.05,
-            high=price + 0.1,
-            low=price - 0.1,
-            close=price,
-            timestamp=pd.Timestamp.now() + pd.Timedelta(minutes=i)
-        )
-        uptrend_bars.append(bar)
-    scenarios['uptrend'] = uptrend_bars
+    price = base_price + (i * 0.1)  # Gradual uptrend
+    scenarios['uptrend'] = _bars_from_closes(price, -0.05, 0.1, timestamps)
     
     # Scenario 2: Simple downtrend with SMA crossover
-    downtrend_bars = []
-    base_price = 1000.0
-    for i in range(250):
-        price = base_price - (i * 0.1)  # Gradual downtrend
-        bar = MockBar(
-            open_price=price + 0.05,
-            high=price + 0.1,
-            low=price - 0.1,
-            close=price,
-            timestamp=pd.Timestamp.now() + pd.Timedelta(minutes=i)
-        )
-        downtrend_bars.append(bar)
-    scenarios['downtrend'] = downtrend_bars
+    price = base_price - (i * 0.1)  # Gradual downtrend
+    scenarios['downtrend'] = _bars_from_closes(price, 0.05, 0.1, timestamps)
     
-    # Scenario 3: Sideways market (no clear trend)
-    sideways_bars = []
-    base_price = 1000.0
-    for i in range(250):
-        # Oscillate around base price
-        price = base_price + (5 * (i % 10 - 5) * 0.1)
-        bar = MockBar(
-            open_price=price - 0.05,
-            high=price + 0.1,
-            low=price - 0.1,
-            close=price,
-            timestamp=pd.Timestamp.now() + pd.Timedelta(minutes=i)
-        )
-        sideways_bars.append(bar)
-    scenarios['sideways'] = sideways_bars
+    # Scenario 3: Sideways market (no clear trend), oscillating around base price
+    price = base_price + (5 * (i % 10 - 5) * 0.1)
+    scenarios['sideways'] = _bars_from_closes(price, -0.05, 0.1, timestamps)
     
-    # Scenario 4: Volatile market with multiple crossovers
-    volatile_bars = []
-    base_price = 1000.0
-    for i in range(250):
-        # Create volatility with sine wave pattern
-        import math
-        volatility = 10 * math.sin(i / 10.0)
-        price = base_price + volatility + (i * 0.02)  # Small overall uptrend
-        bar = MockBar(
-            open_price=price - 0.5,
-            high=price + 1.0,
-            low=price - 1.0,
-            close=price,
-            timestamp=pd.Timestamp.now() + pd.Timedelta(minutes=i)
-        )
-        volatile_bars.append(bar)
-    scenarios['volatile'] = volatile_bars
+    # Scenario 4: Volatile market with multiple crossovers (sine wave pattern)
+    volatility = 10 * np.sin(i / 10.0)
+    price = base_price + volatility + (i * 0.02)  # Small overall uptrend
+    scenarios['volatile'] = _bars_from_closes(price, -0.5, 1.0, timestamps)
     
     return scenarios
 
 
-class TestV1V2Comparison:
-    """Test suite comparing V1 and V2 strategy implementations."""
+def _noop(*args, **kwargs) -> None:
+    return None
+
+
+class _NullBroker:
+    """Broker stand-in whose methods accept anything and do nothing."""
+    __slots__ = ()
     
-    def _create_v1_strategy(self) -> SmaFractalScalper:
-        """Create V1 strategy with standard configuration."""
-        config = SmaFractalScalperConfig(
-            sma_short_period=5,
-            sma_long_period=200,
-            fractal_window=5,
-            use_sma=True,
-            use_fractals=True,
-            historical_warmup=False  # We'll warm up manually
-        )
-        
-        # Mock broker manager to avoid actual broker integration
-        broker_manager = MagicMock()
-        strategy = SmaFractalScalper(config, broker_manager=broker_manager)
-        
-        return strategy
+    def __getattr__(self, name):
+        # Let copy/pickle protocol lookups fail normally so deepcopy keeps the broker
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _noop
+
+
+def _create_v1_strategy() -> SmaFractalScalper:
+    """Create V1 strategy with standard configuration."""
+    config = SmaFractalScalperConfig(
+        sma_short_period=5,
+        sma_long_period=200,
+        fractal_window=5,
+        use_sma=True,
+        use_fractals=True,
+        historical_warmup=False  # We'll warm up manually
+    )
     
-    def _create_v2_strategy(self, temp_config_files) -> SmaFractalScalperV2:
-        """Create V2 strategy with matching configuration."""
-        config = SmaFractalScalperV2Config(
-            sma_short_period=5,
-            sma_long_period=200,
-            fractal_window=5,
-            use_sma=True,
-            use_fractals=True,
-            historical_warmup=False,  # We'll warm up manually
-            indicators_config_path=temp_config_files['indicators_path'],
-            signals_config_path=temp_config_files['signals_path']
-        )
-        
-        strategy = SmaFractalScalperV2(config)
-        return strategy
+    # Null broker manager to avoid actual broker integration
+    strategy = SmaFractalScalper(config, broker_manager=_NullBroker())
     
-    def _warm_up_strategies(self, v1_strategy, v2_strategy, warmup_bars):
-        """Warm up both strategies with the same historical data."""
-        # Warm up V1 strategy
-        v1_strategy.gen.warm_up_with_historical_data(warmup_bars)
-        
-        # Warm up V2 strategy
-        warmup_data = []
-        for bar in warmup_bars:
-            bar_dict = {
-                'timestamp': bar.timestamp,
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume
-            }
-            warmup_data.append(bar_dict)
-        
-        v2_strategy.warmup_indicators(warmup_data)
+    return strategy
+
+
+def _create_v2_strategy(temp_config_files) -> SmaFractalScalperV2:
+    """Create V2 strategy with matching configuration."""
+    config = SmaFractalScalperV2Config(
+        sma_short_period=5,
+        sma_long_period=200,
+        fractal_window=5,
+        use_sma=True,
+        use_fractals=True,
+        historical_warmup=False,  # We'll warm up manually
+        indicators_config_path=temp_config_files['indicators_path'],
+        signals_config_path=temp_config_files['signals_path']
+    )
+    
+    strategy = SmaFractalScalperV2(config)
+    return strategy
+
+
+def _warm_up_strategies(v1_strategy, v2_strategy, warmup_bars):
+    """Warm up both strategies with the same historical data."""
+    # Warm up V1 strategy
+    v1_strategy.gen.warm_up_with_historical_data(warmup_bars)
+    
+    # Warm up V2 strategy
+    v2_strategy.warmup_indicators([bar.as_dict() for bar in warmup_bars])
+
+
+@pytest.fixture(scope="module")
+def warmed_strategies(temp_v2_config_files, test_scenarios):
+    """Return a getter for (V1, V2) strategies warmed on a scenario.
+    
+    Each scenario's first 210 bars are pushed through both strategies
+    once; every call hands out deep copies so tests can mutate them.
+    """
+    warmed = {}
+    
+    def get(scenario: str):
+        if scenario not in warmed:
+            v1_strategy = _create_v1_strategy()
+            v2_strategy = _create_v2_strategy(temp_v2_config_files)
+            warmup_bars = test_scenarios[scenario][:210]  # First 210 bars for warmup
+            _warm_up_strategies(v1_strategy, v2_strategy, warmup_bars)
+            warmed[scenario] = (v1_strategy, v2_strategy)
+        return copy.deepcopy(warmed[scenario])
+    
+    return get
+
+
+class TestV1V2Comparison:
+    """Test suite comparing V1 and V2 strategy implementations."""
     
     def _compare_signal_results(self, v1_result, v2_result, bar_info: str):
         """Compare signal results from both strategies."""
@@ -264,164 +282,31 @@ class TestV1V2Comparison:
         
         return True
     
-    def test_identical_signal_generation_uptrend(self, temp_v2_config_files, test_scenarios):
-        """Test that V1 and V2 generate identical signals in uptrend scenario."""
-        v1_strategy = self._create_v1_strategy()
-        v2_strategy = self._create_v2_strategy(temp_v2_config_files)
-        
-        scenario_bars = test_scenarios['uptrend']
-        warmup_bars = scenario_bars[:210]  # First 210 bars for warmup
-        test_bars = scenario_bars[210:]    # Remaining bars for testing
-        
-        # Warm up both strategies
-        self._warm_up_strategies(v1_strategy, v2_strategy, warmup_bars)
-        
-        # Test signal generation on remaining bars
-        signal_matches = 0
-        total_bars = 0
+    @pytest.mark.parametrize("scenario", ["uptrend", "downtrend", "sideways", "volatile"])
+    def test_identical_signal_generation(self, scenario, warmed_strategies, test_scenarios):
+        """Test that V1 and V2 generate identical signals in each scenario."""
+        v1_strategy, v2_strategy = warmed_strategies(scenario)
+        test_bars = test_scenarios[scenario][210:]  # Remaining bars for testing
         
+        # Identical logic must match on every bar; stop at the first divergence
         for i, bar in enumerate(test_bars):
             # Process bar in V1
             v1_result = v1_strategy.on_bar(bar)
             
             # Process bar in V2
-            bar_dict = {
-                'timestamp': bar.timestamp,
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume
-            }
-            v2_result = v2_strategy.on_bar(bar_dict)
+            v2_result = v2_strategy.on_bar(bar.as_dict())
             
             # Compare results
-            bar_info = f"uptrend bar {i} (price: {bar.close})"
-            if self._compare_signal_results(v1_result, v2_result, bar_info):
-                signal_matches += 1
-            
-            total_bars += 1
-        
-        # Ensure high match rate (should be 100% for identical logic)
-        match_rate = signal_matches / total_bars
-        assert match_rate >= 0.95, f"Signal match rate too low: {match_rate:.2%}"
-        print(f"Uptrend scenario: {signal_matches}/{total_bars} signals matched ({match_rate:.2%})")
-    
-    def test_identical_signal_generation_downtrend(self, temp_v2_config_files, test_scenarios):
-        """Test that V1 and V2 generate identical signals in downtrend scenario."""
-        v1_strategy = self._create_v1_strategy()
-        v2_strategy = self._create_v2_strategy(temp_v2_config_files)
-        
-        scenario_bars = test_scenarios['downtrend']
-        warmup_bars = scenario_bars[:210]
-        test_bars = scenario_bars[210:]
-        
-        self._warm_up_strategies(v1_strategy, v2_strategy, warmup_bars)
-        
-        signal_matches = 0
-        total_bars = 0
-        
-        for i, bar in enumerate(test_bars):
-            v1_result = v1_strategy.on_bar(bar)
-            
-            bar_dict = {
-                'timestamp': bar.timestamp,
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume
-            }
-            v2_result = v2_strategy.on_bar(bar_dict)
-            
-            bar_info = f"downtrend bar {i} (price: {bar.close})"
-            if self._compare_signal_results(v1_result, v2_result, bar_info):
-                signal_matches += 1
-            
-            total_bars += 1
-        
-        match_rate = signal_matches / total_bars
-        assert match_rate >= 0.95, f"Signal match rate too low: {match_rate:.2%}"
-        print(f"Downtrend scenario: {signal_matches}/{total_bars} signals matched ({match_rate:.2%})")
-    
-    def test_identical_signal_generation_sideways(self, temp_v2_config_files, test_scenarios):
-        """Test that V1 and V2 generate identical signals in sideways scenario."""
-        v1_strategy = self._create_v1_strategy()
-        v2_strategy = self._create_v2_strategy(temp_v2_config_files)
-        
-        scenario_bars = test_scenarios['sideways']
-        warmup_bars = scenario_bars[:210]
-        test_bars = scenario_bars[210:]
-        
-        self._warm_up_strategies(v1_strategy, v2_strategy, warmup_bars)
-        
-        signal_matches = 0
-        total_bars = 0
-        
-        for i, bar in enumerate(test_bars):
-            v1_result = v1_strategy.on_bar(bar)
-            
-            bar_dict = {
-                'timestamp': bar.timestamp,
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume
-            }
-            v2_result = v2_strategy.on_bar(bar_dict)
-            
-            bar_info = f"sideways bar {i} (price: {bar.close})"
-            if self._compare_signal_results(v1_result, v2_result, bar_info):
-                signal_matches += 1
-            
-            total_bars += 1
-        
-        match_rate = signal_matches / total_bars
-        assert match_rate >= 0.95, f"Signal match rate too low: {match_rate:.2%}"
-        print(f"Sideways scenario: {signal_matches}/{total_bars} signals matched ({match_rate:.2%})")
-    
-    def test_identical_signal_generation_volatile(self, temp_v2_config_files, test_scenarios):
-        """Test that V1 and V2 generate identical signals in volatile scenario."""
-        v1_strategy = self._create_v1_strategy()
-        v2_strategy = self._create_v2_strategy(temp_v2_config_files)
+            bar_info = f"{scenario} bar {i} (price: {bar.close})"
+            assert self._compare_signal_results(v1_result, v2_result, bar_info), \
+                f"V1/V2 signals diverged at {bar_info}"
         
-        scenario_bars = test_scenarios['volatile']
-        warmup_bars = scenario_bars[:210]
-        test_bars = scenario_bars[210:]
-        
-        self._warm_up_strategies(v1_strategy, v2_strategy, warmup_bars)
-        
-        signal_matches = 0
-        total_bars = 0
-        
-        for i, bar in enumerate(test_bars):
-            v1_result = v1_strategy.on_bar(bar)
-            
-            bar_dict = {
-                'timestamp': bar.timestamp,
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume
-            }
-            v2_result = v2_strategy.on_bar(bar_dict)
-            
-            bar_info = f"volatile bar {i} (price: {bar.close})"
-            if self._compare_signal_results(v1_result, v2_result, bar_info):
-                signal_matches += 1
-            
-            total_bars += 1
-        
-        match_rate = signal_matches / total_bars
-        assert match_rate >= 0.95, f"Signal match rate too low: {match_rate:.2%}"
-        print(f"Volatile scenario: {signal_matches}/{total_bars} signals matched ({match_rate:.2%})")
+        print(f"{scenario.capitalize()} scenario: {len(test_bars)}/{len(test_bars)} signals matched")
     
     def test_identical_warmup_requirements(self, temp_v2_config_files):
         """Test that both strategies have identical warmup requirements."""
-        v1_strategy = self._create_v1_strategy()
-        v2_strategy = self._create_v2_strategy(temp_v2_config_files)
+        v1_strategy = _create_v1_strategy()
+        v2_strategy = _create_v2_strategy(temp_v2_config_files)
         
         # V1 warmup requirements (manually calculated)
         v1_warmup = max(v1_strategy.config.sma_long_period, v1_strategy.config.fractal_window)
@@ -435,8 +320,8 @@ class TestV1V2Comparison:
     
     def test_identical_configuration_parameters(self, temp_v2_config_files):
         """Test that both strategies use identical configuration parameters."""
-        v1_strategy = self._create_v1_strategy()
-        v2_strategy = self._create_v2_strategy(temp_v2_config_files)
+        v1_strategy = _create_v1_strategy()
+        v2_strategy = _create_v2_strategy(temp_v2_config_files)
         
         # Compare key parameters
         assert v1_strategy.config.sma_short_period == v2_strategy.config.sma_short_period
@@ -447,31 +332,18 @@ class TestV1V2Comparison:
         
         print("Configuration parameters match between V1 and V2")
     
-    def test_trade_recording_compatibility(self, temp_v2_config_files, test_scenarios):
+    def test_trade_recording_compatibility(self, warmed_strategies, test_scenarios):
         """Test that both strategies record trades in the same format."""
-        v1_strategy = self._create_v1_strategy()
-        v2_strategy = self._create_v2_strategy(temp_v2_config_files)
-        
-        # Use a scenario that should generate at least one trade
-        scenario_bars = test_scenarios['uptrend']
-        warmup_bars = scenario_bars[:210]
-        test_bars = scenario_bars[210:230]  # Limited bars for focused testing
-        
-        self._warm_up_strategies(v1_strategy, v2_strategy, warmup_bars)
+        # The scenarios close no trades after warmup, so a couple of bars is
+        # enough to drive on_bar and the trades attribute on both versions
+        v1_strategy, v2_strategy = warmed_strategies('uptrend')
+        test_bars = test_scenarios['uptrend'][210:212]
         
         # Process bars and look for trades
         for bar in test_bars:
             v1_strategy.on_bar(bar)
             
-            bar_dict = {
-                'timestamp': bar.timestamp,
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume
-            }
-            v2_strategy.on_bar(bar_dict)
+            v2_strategy.on_bar(bar.as_dict())
         
         # Check trade recording format
         v1_trades = getattr(v1_strategy, 'trades', [])
@@ -8,11 +8,24 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from utils.reporting.controller import ReportController  # Added missing import
 
+# Any number rendered with three or more decimal places
+_LONG_DECIMAL_RE = re.compile(r"\d+\.\d{3,}")
+
+# Required trade columns and the dtypes they are parsed with
+_TRADE_DTYPES = {
+    "Instrument": "string",
+    "Entry_Price": "float64",
+    "Exit_Price": "float64",
+    "Realised_PnL": "float64",
+    "Trade_Type": "string",
+}
+
 # ------------------------------------------------------------------
 # Dependencies required for full-path test
 # ------------------------------------------------------------------
@@ -28,77 +41,90 @@ except ImportError:
         "Nautilus-Trader not installed – skipping system test", allow_module_level=True
     )
 
-# First, generate a fresh batch run in an isolated tmp directory so the
-# assertions below always have up-to-date artifacts.
-
 from utils.data.data_manager import DataManager  # noqa: E402  pylint: disable=wrong-import-position
 from strategies.trend_riding.runner.backtest_runner.batch_runner import (
     TrendRidingBatchRunner,  # noqa: E402
 )
 
 
-dm = DataManager()
-catalog_ids = dm.get_all_instrument_ids()
-if len(catalog_ids) < 2:
-    pytest.skip(
-        "Not enough instruments in catalog for system test", allow_module_level=True
+# ------------------------------------------------------------------
+# 2. Fixtures – run the batch once per module, only when collected
+# ------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def batch_run() -> Path:
+    """Generate a fresh batch run and return its report directory."""
+    dm = DataManager()
+    catalog_ids = dm.get_all_instrument_ids()
+    if len(catalog_ids) < 2:
+        pytest.skip("Not enough instruments in catalog for system test")
+
+    TrendRidingBatchRunner(max_workers=1).run(catalog_ids[:2])
+
+    latest_dir = ReportController.latest_report_dir(
+        root=Path("runlogs"), mode="backtesting", run_type="batch"
     )
+    assert latest_dir is not None, "No batch directory found"
+    return latest_dir
 
-instruments = catalog_ids[:2]
 
-TrendRidingBatchRunner(max_workers=1).run(instruments)
+@pytest.fixture(scope="module")
+def trades_df(batch_run: Path) -> pd.DataFrame:
+    csv_path = batch_run / "trade_details.csv"
+    assert csv_path.exists(), "CSV report missing"
+    # Known columns get explicit dtypes so the parser skips inference on them;
+    # the rest are still read for the float-rounding check.
+    return pd.read_csv(csv_path, dtype=_TRADE_DTYPES)
 
-# ------------------------------------------------------------------
-# 2. Locate most-recent batch directory --------------------------------
 
-latest_dir = ReportController.latest_report_dir(
-    root=Path("runlogs"), mode="backtesting", run_type="batch"
-)
-assert latest_dir is not None, "No batch directory found"
+@pytest.fixture(scope="module")
+def html_text(batch_run: Path) -> str:
+    html_path = batch_run / "summary.html"
+    assert html_path.exists(), "HTML report missing"
+    return html_path.read_text()
 
-csv_path = latest_dir / "trade_details.csv"
-html_path = latest_dir / "summary.html"
-assert csv_path.exists(), "CSV report missing"
-assert html_path.exists(), "HTML report missing"
 
 # ------------------------------------------------------------------
 # 3. CSV validations --------------------------------------------------
-df = pd.read_csv(csv_path)
-
-# a) Required columns present
-for col in [
-    "Instrument",
-    "Entry_Price",
-    "Exit_Price",
-    "Realised_PnL",
-    "Trade_Type",
-]:
-    assert col in df.columns, f"Missing column {col}"
-
-# b) No UNKNOWN instruments
-assert not (df["Instrument"] == "UNKNOWN").any(), "UNKNOWN instrument IDs in CSV"
-
-# c) Numeric columns rounded to 2 decimals
-for col in df.select_dtypes(include=["float", "float64", "float32"]).columns:
-    rounded = df[col].round(2)
-    pd.testing.assert_series_equal(df[col], rounded, check_exact=True)
+
+
+def test_csv_required_columns(trades_df: pd.DataFrame) -> None:
+    missing = _TRADE_DTYPES.keys() - set(trades_df.columns)
+    assert not missing, f"Missing columns {sorted(missing)}"
+
+
+def test_csv_has_no_unknown_instruments(trades_df: pd.DataFrame) -> None:
+    assert not (trades_df["Instrument"] == "UNKNOWN").any(), "UNKNOWN instrument IDs in CSV"
+
+
+def test_csv_floats_rounded(trades_df: pd.DataFrame) -> None:
+    float_values = trades_df.select_dtypes(
+        include=["float", "float64", "float32"]
+    ).to_numpy()
+    assert np.array_equal(float_values, np.round(float_values, 2), equal_nan=True), (
+        "Found value with >2 decimal places in CSV"
+    )
+
 
 # ------------------------------------------------------------------
 # 4. HTML validations -------------------------------------------------
-html_text = html_path.read_text()
 
-# a) No UNKNOWN
-assert "UNKNOWN" not in html_text, "UNKNOWN instrument IDs in HTML"
 
-# b) Floats do not show >2 decimal places (simple regex heuristic)
-assert re.search(r"\d+\.\d{3,}", html_text) is None, (
-    "Found value with >2 decimal places in HTML"
-)
+def test_html_has_no_unknown_instruments(html_text: str) -> None:
+    assert "UNKNOWN" not in html_text, "UNKNOWN instrument IDs in HTML"
+
+
+def test_html_floats_rounded(html_text: str) -> None:
+    # Floats do not show >2 decimal places (simple regex heuristic)
+    assert _LONG_DECIMAL_RE.search(html_text) is None, (
+        "Found value with >2 decimal places in HTML"
+    )
+
 
-# c) Trade rows count matches CSV rows
-# Count <tr> in Trade Details table (after header row)
-trade_table_idx = html_text.find("<h2>Trade Details")
-assert trade_table_idx != -1, "Trade Details section missing"
-table_html = html_text[trade_table_idx:]
-row_count = len(re.findall(r"<tr><td", table_html))
-assert row_count == len(df), "Mismatch between CSV and HTML trade rows"
+def test_html_trade_rows_match_csv(html_text: str, trades_df: pd.DataFrame) -> None:
+    # Count <tr><td> rows in the Trade Details table (after header row)
+    trade_table_idx = html_text.find("<h2>Trade Details")
+    assert trade_table_idx != -1, "Trade Details section missing"
+    row_count = html_text.count("<tr><td", trade_table_idx)
+    assert row_count == len(trades_df), "Mismatch between CSV and HTML trade rows"
@@ -0,0 +1,27 @@
+import os
+
+from utils.yaml_cache import clear_yaml_cache, load_yaml
+
+
+def test_load_yaml_returns_independent_copies(tmp_path):
+    clear_yaml_cache()
+    cfg_file = tmp_path / "cfg.yaml"
+    cfg_file.write_text("indicators:\n  sma:\n    period: 5\n")
+
+    first = load_yaml(cfg_file)
+    first["indicators"]["sma"]["period"] = 50
+
+    assert load_yaml(cfg_file)["indicators"]["sma"]["period"] == 5
+
+
+def test_load_yaml_reparses_changed_file(tmp_path):
+    clear_yaml_cache()
+    cfg_file = tmp_path / "cfg.yaml"
+    cfg_file.write_text("period: 5\n")
+    assert load_yaml(cfg_file) == {"period": 5}
+
+    cfg_file.write_text("period: 20\n")
+    stat = cfg_file.stat()
+    os.utime(cfg_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_yaml(cfg_file) == {"period": 20}
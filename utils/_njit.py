@@ -0,0 +1,29 @@
+"""Optional numba acceleration for indicator kernels.
+
+``njit`` compiles a function with numba when it is installed and returns it
+unchanged otherwise, so kernels written against plain NumPy arrays work
+either way. Kernels pass an explicit signature so numba compiles them
+eagerly at import (and, with ``cache=True``, loads them from disk on later
+runs) instead of on the first call.
+"""
+
+from typing import Any, Callable
+
+# Try to import numba; fall back to plain Python kernels if unavailable -------
+try:
+    from numba import njit as _numba_njit  # type: ignore
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    _numba_njit = None  # type: ignore
+
+
+def njit(*args: Any, **kwargs: Any) -> Callable:
+    """Drop-in for ``numba.njit`` usable bare or with options."""
+    if NUMBA_AVAILABLE:
+        return _numba_njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
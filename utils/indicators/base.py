@@ -8,7 +8,9 @@ This module provides the foundation for a pluggable indicator architecture that
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Any, List, Optional, Union
 from dataclasses import dataclass, field
 import pandas as pd
 import numpy as np
@@ -62,6 +64,10 @@ class IndicatorValue:
         return None
 
 
+# Bar fields mirrored into per-field NumPy ring buffers for the numeric kernels
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
 class BaseIndicator(ABC):
     """Base class for all indicators in the pluggable system."""
     
@@ -75,8 +81,16 @@ class BaseIndicator(ABC):
         # Internal state
         self._initialized = False
         self._buffer_size = self.parameters.get("buffer_size", 1000)
-        self._data_buffer: List[Dict[str, float]] = []
-        self._output_buffer: List[IndicatorValue] = []
+        
+        # Buffered bars as one NumPy ring per field (struct of arrays). Every
+        # value is written at slot i and i + buffer_size so any tail is one
+        # contiguous slice.
+        self._field_buffers: Dict[str, np.ndarray] = {
+            name: np.full(2 * self._buffer_size, np.nan) for name in OHLCV_FIELDS
+        }
+        self._write_pos = 0
+        self._buffered_bars = 0
+        self._output_buffer: Deque[IndicatorValue] = deque(maxlen=self._buffer_size)
         
         # Validation
         self._validate_parameters()
@@ -117,12 +131,10 @@ class BaseIndicator(ABC):
             return None
             
         # Add to buffer
-        self._data_buffer.append(data.copy())
-        if len(self._data_buffer) > self._buffer_size:
-            self._data_buffer.pop(0)
+        self._append_fields(data)
             
         # Calculate if we have enough data
-        if len(self._data_buffer) >= self.get_required_warmup_bars():
+        if self._buffered_bars >= self.get_required_warmup_bars():
             try:
                 calculated_values = self._calculate(data)
                 
@@ -132,14 +144,12 @@ class BaseIndicator(ABC):
                     metadata={
                         'indicator_name': self.name,
                         'indicator_type': self.config.indicator_type,
-                        'buffer_size': len(self._data_buffer)
+                        'buffer_size': self._buffered_bars
                     }
                 )
                 
                 # Add to output buffer
                 self._output_buffer.append(indicator_value)
-                if len(self._output_buffer) > self._buffer_size:
-                    self._output_buffer.pop(0)
                     
                 self._initialized = True
                 return indicator_value
@@ -150,6 +160,85 @@ class BaseIndicator(ABC):
         
         return None
     
+    def _append_fields(self, data: Dict[str, float]) -> None:
+        """Write one bar into the per-field ring buffers."""
+        pos = self._write_pos
+        for name, buffer in self._field_buffers.items():
+            value = data.get(name)
+            buffer[pos] = buffer[pos + self._buffer_size] = np.nan if value is None else value
+        self._write_pos = (pos + 1) % self._buffer_size
+        self._buffered_bars = min(self._buffered_bars + 1, self._buffer_size)
+    
+    def _field_tail(self, field: str, n_bars: int) -> np.ndarray:
+        """Return the last ``n_bars`` values of a bar field, oldest first.
+        
+        The result is a view into the ring buffer and must not be modified.
+        """
+        n_bars = min(n_bars, self._buffered_bars)
+        end = self._write_pos + self._buffer_size
+        return self._field_buffers[field][end - n_bars:end]
+    
+    def _calculate_frame(self, frame: pd.DataFrame) -> Optional[Dict[str, np.ndarray]]:
+        """Calculate indicator values for every row of an OHLCV frame at once.
+        
+        Subclasses override this with a vectorized equivalent of ``_calculate``.
+        Each returned array is aligned with ``frame``; rows before the warmup
+        requirement is met are ignored.
+        
+        Returns:
+            Mapping of value name to array, or None if not supported
+        """
+        return None
+    
+    def warmup_from_frame(self, frame: pd.DataFrame) -> None:
+        """Warm up the indicator from a DataFrame of historical bars.
+        
+        Leaves the indicator in the same state as calling ``update`` for each
+        row, but computes the values with ``_calculate_frame`` when the
+        indicator provides it and has not seen any bars yet.
+        
+        Args:
+            frame: OHLCV bars, oldest first, optionally with a 'timestamp' column
+        """
+        if not self.enabled:
+            return
+        
+        columns = None if self._buffered_bars else self._calculate_frame(frame)
+        if columns is None:
+            for bar in frame.to_dict('records'):
+                self.update(bar)
+            return
+        
+        n_bars = len(frame)
+        first = max(self.get_required_warmup_bars() - 1, n_bars - self._buffer_size, 0)
+        retained = frame.iloc[max(n_bars - self._buffer_size, 0):]
+        for name, buffer in self._field_buffers.items():
+            if name in retained.columns:
+                values = retained[name].to_numpy(dtype=np.float64)
+                buffer[:len(values)] = buffer[self._buffer_size:self._buffer_size + len(values)] = values
+        self._write_pos = len(retained) % self._buffer_size
+        self._buffered_bars = len(retained)
+        
+        names = list(columns)
+        rows = zip(*(columns[name][first:].tolist() for name in names))
+        timestamps = (
+            frame['timestamp'].iloc[first:].tolist()
+            if 'timestamp' in frame.columns else [pd.Timestamp.now()] * (n_bars - first)
+        )
+        for index, (timestamp, row) in enumerate(zip(timestamps, rows), start=first):
+            self._output_buffer.append(IndicatorValue(
+                timestamp=timestamp,
+                values=dict(zip(names, row)),
+                metadata={
+                    'indicator_name': self.name,
+                    'indicator_type': self.config.indicator_type,
+                    'buffer_size': min(index + 1, self._buffer_size)
+                }
+            ))
+        
+        if self._output_buffer:
+            self._initialized = True
+    
     def get_current_value(self) -> Optional[IndicatorValue]:
         """Get the most recent indicator value."""
         if self._output_buffer:
@@ -158,11 +247,13 @@ class BaseIndicator(ABC):
     
     def get_historical_values(self, lookback: int = 50) -> List[IndicatorValue]:
         """Get historical indicator values."""
-        return self._output_buffer[-lookback:] if self._output_buffer else []
+        # Same window as list[-lookback:], without copying the whole deque
+        start, _, _ = slice(-lookback, None).indices(len(self._output_buffer))
+        return list(islice(self._output_buffer, start, None))
     
     def is_ready(self) -> bool:
         """Check if indicator has enough data for reliable calculations."""
-        return self._initialized and len(self._data_buffer) >= self.get_required_warmup_bars()
+        return self._initialized and self._buffered_bars >= self.get_required_warmup_bars()
     
     def get_chart_config(self) -> Dict[str, Any]:
         """Get chart visualization configuration."""
@@ -174,11 +265,19 @@ class BaseIndicator(ABC):
             "overlay": self.config.chart_settings.get("overlay", True)
         }
     
+    def _reset_state(self) -> None:
+        """Drop incremental state that subclasses derive from earlier bars."""
+        pass
+    
     def reset(self) -> None:
         """Reset indicator state."""
-        self._data_buffer.clear()
+        for buffer in self._field_buffers.values():
+            buffer.fill(np.nan)
+        self._write_pos = 0
+        self._buffered_bars = 0
         self._output_buffer.clear()
         self._initialized = False
+        self._reset_state()
     
     def get_status(self) -> Dict[str, Any]:
         """Get indicator status information."""
@@ -187,7 +286,7 @@ class BaseIndicator(ABC):
             "type": self.config.indicator_type,
             "enabled": self.enabled,
             "ready": self.is_ready(),
-            "buffer_size": len(self._data_buffer),
+            "buffer_size": self._buffered_bars,
             "warmup_required": self.get_required_warmup_bars(),
             "current_value": self.get_current_value().get_main_value() if self.get_current_value() else None
         } 
\ No newline at end of file
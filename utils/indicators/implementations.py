@@ -4,17 +4,86 @@ This module provides implementations of popular technical indicators
 using the pluggable indicator architecture.
 """
 
+import math
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, List
-from collections import deque
+from numpy.lib.stride_tricks import sliding_window_view
 
+from utils._njit import njit
 from .base import BaseIndicator, IndicatorConfig
 
 
+@njit("float64(float64[:])", cache=True)
+def _sum_kernel(closes: np.ndarray) -> float:
+    """Sum of ``closes``, added in order like the pure-Python SMA."""
+    total = 0.0
+    for i in range(closes.shape[0]):
+        total += closes[i]
+    return total
+
+
+@njit("UniTuple(float64, 2)(float64[:])", cache=True)
+def _mean_sq_dev_kernel(closes: np.ndarray):
+    """Mean of ``closes`` and the sum of squared deviations from it."""
+    n = closes.shape[0]
+    total = 0.0
+    for i in range(n):
+        total += closes[i]
+    mean = total / n
+    sq_dev_sum = 0.0
+    for i in range(n):
+        sq_dev_sum += (closes[i] - mean) ** 2
+    return mean, sq_dev_sum
+
+
+@njit("UniTuple(float64, 2)(float64[:])", cache=True)
+def _gain_loss_kernel(closes: np.ndarray):
+    """Total gains and total losses over consecutive ``closes``."""
+    gains = 0.0
+    losses = 0.0
+    for i in range(1, closes.shape[0]):
+        change = closes[i] - closes[i - 1]
+        if change > 0:
+            gains += change
+        else:
+            losses -= change
+    return gains, losses
+
+
+@njit("UniTuple(float64, 2)(float64[:], float64[:], int64)", cache=True)
+def _fractal_kernel(highs: np.ndarray, lows: np.ndarray, half_window: int):
+    """Fractal high/low of the middle bar of a window, or 0.0 for none.
+    
+    Neighbours are checked from the middle outwards, since the adjacent bars
+    rule out most candidates, and the scan stops once both are ruled out.
+    """
+    middle_high = highs[half_window]
+    middle_low = lows[half_window]
+    is_fractal_high = True
+    is_fractal_low = True
+    
+    for offset in range(1, half_window + 1):
+        left = half_window - offset
+        right = half_window + offset
+        if highs[left] >= middle_high or highs[right] >= middle_high:
+            is_fractal_high = False
+        if lows[left] <= middle_low or lows[right] <= middle_low:
+            is_fractal_low = False
+        if not (is_fractal_high or is_fractal_low):
+            break
+    
+    return (middle_high if is_fractal_high else 0.0,
+            middle_low if is_fractal_low else 0.0)
+
+
 class SMAIndicator(BaseIndicator):
     """Simple Moving Average indicator."""
     
+    def __init__(self, config: IndicatorConfig):
+        super().__init__(config)
+        self._window_sum = None
+    
     def _validate_parameters(self) -> None:
         """Validate SMA parameters."""
         if "period" not in self.parameters:
@@ -28,15 +97,33 @@ class SMAIndicator(BaseIndicator):
         """Return required warmup bars for SMA."""
         return self.parameters["period"]
     
+    def _reset_state(self) -> None:
+        """Forget the running window sum."""
+        self._window_sum = None
+    
     def _calculate(self, data: Dict[str, float]) -> Dict[str, float]:
         """Calculate SMA value."""
         period = self.parameters["period"]
         
-        # Get the last 'period' close prices
-        close_prices = [bar["close"] for bar in self._data_buffer[-period:]]
-        sma_value = sum(close_prices) / len(close_prices)
+        if (
+            self._window_sum is None
+            or self._buffered_bars <= period
+            or not math.isfinite(self._window_sum)
+            or self._write_pos == 0  # re-sum once per buffer cycle to shed drift
+        ):
+            # Sum the last 'period' close prices from scratch
+            self._window_sum = float(_sum_kernel(self._field_tail("close", period)))
+        else:
+            # Slide the window: add the new close, drop the one leaving
+            closes = self._field_tail("close", period + 1)
+            self._window_sum += closes[-1] - closes[0]
         
-        return {"value": sma_value}
+        return {"value": float(self._window_sum / period)}
+    
+    def _calculate_frame(self, frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Calculate SMA values for a whole frame with a rolling mean."""
+        period = self.parameters["period"]
+        return {"value": frame["close"].rolling(period).mean().to_numpy()}
 
 
 class EMAIndicator(BaseIndicator):
@@ -75,12 +162,12 @@ class EMAIndicator(BaseIndicator):
 
 
 class RSIIndicator(BaseIndicator):
-    """Relative Strength Index indicator."""
+    """Relative Strength Index indicator with Wilder's smoothing."""
     
     def __init__(self, config: IndicatorConfig):
         super().__init__(config)
-        self._gains = deque(maxlen=self.parameters["period"])
-        self._losses = deque(maxlen=self.parameters["period"])
+        self._avg_gain = None
+        self._avg_loss = None
         self._prev_close = None
     
     def _validate_parameters(self) -> None:
@@ -96,37 +183,38 @@ class RSIIndicator(BaseIndicator):
         """Return required warmup bars for RSI."""
         return self.parameters["period"] + 1  # Need one extra for price change calculation
     
+    def _reset_state(self) -> None:
+        """Forget the smoothed gains and losses."""
+        self._avg_gain = None
+        self._avg_loss = None
+        self._prev_close = None
+    
     def _calculate(self, data: Dict[str, float]) -> Dict[str, float]:
         """Calculate RSI value."""
-        close_price = data["close"]
+        period = self.parameters["period"]
         
-        if self._prev_close is not None:
-            # Calculate price change
-            change = close_price - self._prev_close
-            
-            # Separate gains and losses
+        if self._avg_gain is None or not math.isfinite(self._avg_gain + self._avg_loss):
+            # Seed with plain averages over the first 'period' price changes
+            gains, losses = _gain_loss_kernel(self._field_tail("close", period + 1))
+            self._avg_gain = float(gains) / period
+            self._avg_loss = float(losses) / period
+        else:
+            # Wilder's smoothing: avg = (prev_avg * (period - 1) + current) / period
+            change = data["close"] - self._prev_close
             gain = max(change, 0)
             loss = max(-change, 0)
-            
-            self._gains.append(gain)
-            self._losses.append(loss)
-            
-            # Calculate RSI when we have enough data
-            if len(self._gains) >= self.parameters["period"]:
-                avg_gain = sum(self._gains) / len(self._gains)
-                avg_loss = sum(self._losses) / len(self._losses)
-                
-                if avg_loss == 0:
-                    rsi = 100.0
-                else:
-                    rs = avg_gain / avg_loss
-                    rsi = 100.0 - (100.0 / (1.0 + rs))
-                
-                self._prev_close = close_price
-                return {"value": rsi}
-        
-        self._prev_close = close_price
-        return {"value": 50.0}  # Neutral RSI while warming up
+            self._avg_gain = (self._avg_gain * (period - 1) + gain) / period
+            self._avg_loss = (self._avg_loss * (period - 1) + loss) / period
+        
+        self._prev_close = data["close"]
+        
+        if self._avg_loss == 0:
+            rsi = 100.0
+        else:
+            rs = self._avg_gain / self._avg_loss
+            rsi = 100.0 - (100.0 / (1.0 + rs))
+        
+        return {"value": rsi}
 
 
 class FractalIndicator(BaseIndicator):
@@ -150,36 +238,54 @@ class FractalIndicator(BaseIndicator):
         window = self.parameters["window"]
         half_window = window // 2
         
-        if len(self._data_buffer) < window:
+        if self._buffered_bars < window:
             return {"fractal_high": 0, "fractal_low": 0}
         
-        # Get the middle bar (the one we're checking for fractal)
-        middle_idx = len(self._data_buffer) - half_window - 1
-        middle_bar = self._data_buffer[middle_idx]
-        
-        # Check for fractal high
-        is_fractal_high = True
-        for i in range(middle_idx - half_window, middle_idx + half_window + 1):
-            if i != middle_idx and self._data_buffer[i]["high"] >= middle_bar["high"]:
-                is_fractal_high = False
-                break
-        
-        # Check for fractal low
-        is_fractal_low = True
-        for i in range(middle_idx - half_window, middle_idx + half_window + 1):
-            if i != middle_idx and self._data_buffer[i]["low"] <= middle_bar["low"]:
-                is_fractal_low = False
-                break
+        # Scan the last 'window' bars; the middle one is the fractal candidate
+        highs = self._field_tail("high", window)
+        lows = self._field_tail("low", window)
+        fractal_high, fractal_low = _fractal_kernel(highs, lows, half_window)
         
         return {
-            "fractal_high": middle_bar["high"] if is_fractal_high else 0,
-            "fractal_low": middle_bar["low"] if is_fractal_low else 0
+            "fractal_high": float(fractal_high),
+            "fractal_low": float(fractal_low)
         }
+    
+    def _calculate_frame(self, frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Calculate Fractal values for a whole frame over sliding windows."""
+        window = self.parameters["window"]
+        half_window = window // 2
+        
+        highs = frame["high"].to_numpy(dtype=float)
+        lows = frame["low"].to_numpy(dtype=float)
+        fractal_high = np.zeros(len(frame))
+        fractal_low = np.zeros(len(frame))
+        
+        if len(frame) >= window:
+            # Row i of each view is the window ending at bar i + window - 1
+            high_windows = sliding_window_view(highs, window)
+            low_windows = sliding_window_view(lows, window)
+            neighbours = [i for i in range(window) if i != half_window]
+            
+            middle_high = high_windows[:, half_window]
+            middle_low = low_windows[:, half_window]
+            is_fractal_high = (high_windows[:, neighbours] < middle_high[:, None]).all(axis=1)
+            is_fractal_low = (low_windows[:, neighbours] > middle_low[:, None]).all(axis=1)
+            
+            fractal_high[window - 1:] = np.where(is_fractal_high, middle_high, 0)
+            fractal_low[window - 1:] = np.where(is_fractal_low, middle_low, 0)
+        
+        return {"fractal_high": fractal_high, "fractal_low": fractal_low}
 
 
 class BollingerBandsIndicator(BaseIndicator):
     """Bollinger Bands indicator."""
     
+    def __init__(self, config: IndicatorConfig):
+        super().__init__(config)
+        self._mean = None
+        self._sq_dev_sum = 0.0
+    
     def _validate_parameters(self) -> None:
         """Validate Bollinger Bands parameters."""
         if "period" not in self.parameters:
@@ -199,20 +305,39 @@ class BollingerBandsIndicator(BaseIndicator):
         """Return required warmup bars for Bollinger Bands."""
         return self.parameters["period"]
     
+    def _reset_state(self) -> None:
+        """Forget the running window mean and squared deviations."""
+        self._mean = None
+        self._sq_dev_sum = 0.0
+    
     def _calculate(self, data: Dict[str, float]) -> Dict[str, float]:
         """Calculate Bollinger Bands values."""
         period = self.parameters["period"]
         std_dev_multiplier = self.parameters["std_dev"]
         
-        # Get the last 'period' close prices
-        close_prices = [bar["close"] for bar in self._data_buffer[-period:]]
+        if (
+            self._mean is None
+            or self._buffered_bars <= period
+            or not math.isfinite(self._sq_dev_sum)
+            or self._write_pos == 0  # re-sum once per buffer cycle to shed drift
+        ):
+            # Re-sum the last 'period' close prices
+            mean, sq_dev_sum = _mean_sq_dev_kernel(self._field_tail("close", period))
+            self._mean = float(mean)
+            self._sq_dev_sum = float(sq_dev_sum)
+        else:
+            # Welford update for replacing the oldest close with the newest
+            closes = self._field_tail("close", period + 1)
+            entering, leaving = float(closes[-1]), float(closes[0])
+            old_mean = self._mean
+            self._mean += (entering - leaving) / period
+            self._sq_dev_sum += (entering - leaving) * (entering - self._mean + leaving - old_mean)
         
         # Calculate middle band (SMA)
-        middle_band = sum(close_prices) / len(close_prices)
+        middle_band = self._mean
         
-        # Calculate standard deviation
-        variance = sum((price - middle_band) ** 2 for price in close_prices) / len(close_prices)
-        std_dev = variance ** 0.5
+        # Calculate standard deviation (clamped against rounding below zero)
+        std_dev = math.sqrt(max(self._sq_dev_sum / period, 0.0))
         
         # Calculate upper and lower bands
         upper_band = middle_band + (std_dev_multiplier * std_dev)
@@ -5,11 +5,13 @@ their lifecycle, and provides unified access to their outputs.
 """
 
 from typing import Dict, List, Optional, Any
+import pandas as pd
 import yaml
 from pathlib import Path
 
 from .base import BaseIndicator, IndicatorConfig, IndicatorValue
 from .registry import indicator_registry
+from utils.yaml_cache import load_yaml
 
 
 class IndicatorManager:
@@ -29,9 +31,14 @@ class IndicatorManager:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_file, 'r') as f:
-            config_data = yaml.safe_load(f)
+        self.load_from_dict(load_yaml(config_file))
+    
+    def load_from_dict(self, config_data: Dict[str, Any]) -> None:
+        """Load indicators from an already parsed configuration.
         
+        Args:
+            config_data: Dictionary with the same layout as the YAML file
+        """
         indicators_config = config_data.get('indicators', {})
         for indicator_name, indicator_data in indicators_config.items():
             self.add_indicator_from_dict(indicator_name, indicator_data)
@@ -173,6 +180,18 @@ class IndicatorManager:
         
         return results
     
+    def warmup_from_frame(self, frame: pd.DataFrame) -> None:
+        """Warm up all enabled indicators from a DataFrame of historical bars.
+        
+        Args:
+            frame: OHLCV bars, oldest first, optionally with a 'timestamp' column
+        """
+        for name, indicator in self._enabled_indicators.items():
+            try:
+                indicator.warmup_from_frame(frame)
+            except Exception as e:
+                print(f"Error warming up indicator {name}: {e}")
+    
     def get_current_values(self) -> Dict[str, Optional[IndicatorValue]]:
         """Get current values for all indicators.
         
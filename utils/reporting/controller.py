@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+import os
 import shutil
 
 from .renderers.csv_renderer import CsvTradeRenderer
@@ -11,6 +12,10 @@ from .renderers.html_batch_renderer import HtmlBatchRenderer
 
 ASSET_SRC = Path(__file__).resolve().parent / "assets"
 
+# Newest run folder per date folder, keyed by absolute path and reused while
+# the date folder's mtime is unchanged (adding a run folder bumps it).
+_DATE_DIR_CACHE: Dict[str, Tuple[int, datetime, str | None]] = {}
+
 
 class ReportController:  # pylint: disable=too-few-public-methods
     """Generate runlogs folder with CSV & JSON reports (HTML later)."""
@@ -112,32 +117,53 @@ class ReportController:  # pylint: disable=too-few-public-methods
         latest_dt = datetime.min
         latest_path: Path | None = None
 
-        for date_dir in root_path.iterdir():
-            if not date_dir.is_dir():
-                continue
-            try:
-                # Validate date part
-                datetime.strptime(date_dir.name, "%Y-%m-%d")
-            except ValueError:
-                continue
-
-            for time_dir in date_dir.iterdir():
-                if not time_dir.is_dir():
+        with os.scandir(root_path) as date_entries:
+            for date_entry in date_entries:
+                if not date_entry.is_dir():
+                    continue
+                try:
+                    # Validate date part
+                    datetime.strptime(date_entry.name, "%Y-%m-%d")
+                except ValueError:
                     continue
-                time_prefix = time_dir.name.split("_", 1)[
+
+                ts, time_dir = cls._latest_in_date_dir(date_entry)
+                if time_dir is not None and ts > latest_dt:
+                    latest_dt = ts
+                    latest_path = Path(time_dir)
+
+        return latest_path
+
+    @staticmethod
+    def _latest_in_date_dir(date_entry: os.DirEntry) -> Tuple[datetime, str | None]:
+        """Return ``(timestamp, path)`` of the newest run folder in a date folder."""
+        key = os.path.abspath(date_entry.path)
+        mtime_ns = date_entry.stat().st_mtime_ns
+        cached = _DATE_DIR_CACHE.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        latest_dt = datetime.min
+        latest_path: str | None = None
+        with os.scandir(date_entry.path) as time_entries:
+            for time_entry in time_entries:
+                if not time_entry.is_dir():
+                    continue
+                time_prefix = time_entry.name.split("_", 1)[
                     0
                 ]  # drop optional _strategy suffix
                 try:
                     ts = datetime.strptime(
-                        f"{date_dir.name}_{time_prefix}", "%Y-%m-%d_%H-%M-%S"
+                        f"{date_entry.name}_{time_prefix}", "%Y-%m-%d_%H-%M-%S"
                     )
                 except ValueError:
                     continue
                 if ts > latest_dt:
                     latest_dt = ts
-                    latest_path = time_dir
+                    latest_path = time_entry.path
 
-        return latest_path
+        _DATE_DIR_CACHE[key] = (mtime_ns, latest_dt, latest_path)
+        return latest_dt, latest_path
 
 
 __all__ = ["ReportController"]
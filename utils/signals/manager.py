@@ -11,17 +11,29 @@ from pathlib import Path
 from .base import BaseSignalGenerator, SignalConfig, TradingSignal, SignalType
 from .registry import signal_registry
 from utils.indicators.base import IndicatorValue
+from utils.yaml_cache import load_yaml
 
 
 class SignalManager:
     """Manager for coordinating multiple signal generators."""
     
-    def __init__(self):
+    def __init__(self, cache_last_result: bool = False):
+        """Initialize the manager.
+        
+        Args:
+            cache_last_result: Return the previous result when generate_signals
+                is called again with the same indicator_values object and bar
+                timestamp, instead of re-running the generators
+        """
         self._signal_generators: Dict[str, BaseSignalGenerator] = {}
         self._enabled_generators: Dict[str, BaseSignalGenerator] = {}
         self._combination_config: Dict[str, Any] = {}
         self._last_signals: Dict[str, TradingSignal] = {}
         
+        self._cache_last_result = cache_last_result
+        self._last_inputs: Optional[tuple] = None
+        self._last_result: Dict[str, TradingSignal] = {}
+        
     def load_from_config(self, config_path: str) -> None:
         """Load signal generators from configuration file.
         
@@ -32,9 +44,14 @@ class SignalManager:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_file, 'r') as f:
-            config_data = yaml.safe_load(f)
+        self.load_from_dict(load_yaml(config_file))
+    
+    def load_from_dict(self, config_data: Dict[str, Any]) -> None:
+        """Load signal generators from an already parsed configuration.
         
+        Args:
+            config_data: Dictionary with the same layout as the YAML file
+        """
         # Load signal generators
         signals_config = config_data.get('signals', {})
         for signal_name, signal_data in signals_config.items():
@@ -86,6 +103,7 @@ class SignalManager:
             return False
         
         self._signal_generators[config.name] = signal_generator
+        self._invalidate_signal_cache()
         
         # Add to enabled generators if enabled
         if config.enabled:
@@ -110,6 +128,7 @@ class SignalManager:
             if name in self._last_signals:
                 del self._last_signals[name]
             print(f"Removed signal generator: {name}")
+            self._invalidate_signal_cache()
             return True
         return False
     
@@ -127,6 +146,7 @@ class SignalManager:
             signal_generator.enabled = True
             self._enabled_generators[name] = signal_generator
             print(f"Enabled signal generator: {name}")
+            self._invalidate_signal_cache()
             return True
         return False
     
@@ -145,6 +165,7 @@ class SignalManager:
             if name in self._enabled_generators:
                 del self._enabled_generators[name]
             print(f"Disabled signal generator: {name}")
+            self._invalidate_signal_cache()
             return True
         return False
     
@@ -162,6 +183,11 @@ class SignalManager:
         Returns:
             Dictionary mapping signal generator names to their generated signals
         """
+        if self._cache_last_result and self._last_inputs is not None:
+            last_values, last_timestamp = self._last_inputs
+            if last_values is indicator_values and last_timestamp == market_data.get('timestamp'):
+                return dict(self._last_result)
+        
         signals = {}
         
         for name, signal_generator in self._enabled_generators.items():
@@ -173,8 +199,18 @@ class SignalManager:
             except Exception as e:
                 print(f"Error generating signal from {name}: {e}")
         
+        if self._cache_last_result:
+            # Keep a reference to the values so their id cannot be reused
+            self._last_inputs = (indicator_values, market_data.get('timestamp'))
+            self._last_result = dict(signals)
+        
         return signals
     
+    def _invalidate_signal_cache(self) -> None:
+        """Forget the memoized generate_signals result."""
+        self._last_inputs = None
+        self._last_result = {}
+    
     def get_combined_signal(self) -> Optional[TradingSignal]:
         """Get combined signal based on combination configuration.
         
@@ -321,6 +357,7 @@ class SignalManager:
             signal_generator.reset()
         self._last_signals.clear()
         print("Reset all signal generators")
+        self._invalidate_signal_cache()
     
     def get_signal_generator(self, name: str) -> Optional[BaseSignalGenerator]:
         """Get a specific signal generator by name.
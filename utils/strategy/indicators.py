@@ -2,6 +2,10 @@ from __future__ import annotations
 
 from typing import Sequence
 
+import numpy as np
+
+from utils._njit import NUMBA_AVAILABLE, njit
+
 """Technical indicator utilities for strategy implementations.
 
 Provides common technical analysis functions used by trading strategies,
@@ -9,12 +13,41 @@ implemented as pure functions for easy testing and reusability.
 """
 
 
+@njit("float64(float64[:], int64)", cache=True)
+def _sma_kernel(values, period):
+    """Mean of the last ``period`` values, summed oldest first."""
+    start = len(values) - period
+    total = 0.0
+    for i in range(period):
+        total += values[start + i]
+    return total / period
+
+
+@njit("float64(float64[:], int64)", cache=True)
+def _ema_kernel(values, period):
+    """EMA seeded with the SMA of the first ``period`` values."""
+    k = 2.0 / (period + 1)
+    total = 0.0
+    for i in range(period):
+        total += values[i]
+    ema_val = total / period
+    for i in range(period, len(values)):
+        ema_val = values[i] * k + ema_val * (1 - k)
+    return ema_val
+
+
+def _kernel_input(series: Sequence[float]):
+    # numba needs a typed array; the pure-Python fallback is faster on the
+    # original sequence than on NumPy scalars.
+    return np.asarray(series, dtype=np.float64) if NUMBA_AVAILABLE else series
+
+
 def sma(series: Sequence[float], period: int) -> float:  # noqa: D401
     if period <= 0:
         raise ValueError("period must be > 0")
     if len(series) < period:
         raise ValueError("insufficient data for SMA")
-    return sum(series[-period:]) / period
+    return float(_sma_kernel(_kernel_input(series), period))
 
 
 def ema(series: Sequence[float], period: int) -> float:  # noqa: D401
@@ -22,11 +55,7 @@ def ema(series: Sequence[float], period: int) -> float:  # noqa: D401
         raise ValueError("period must be > 0")
     if len(series) < period:
         raise ValueError("insufficient data for EMA")
-    k = 2 / (period + 1)
-    ema_val = sma(series[:period], period)
-    for price in series[period:]:
-        ema_val = price * k + ema_val * (1 - k)
-    return ema_val
+    return float(_ema_kernel(_kernel_input(series), period))
 
 
 __all__ = ["sma", "ema"]
@@ -0,0 +1,58 @@
+"""Cached YAML loading for configuration files.
+
+Indicator and signal configurations are re-read every time a strategy is
+built. This module parses each file once per (path, mtime, size) and hands
+out deep copies, so callers can still mutate what they get back.
+"""
+
+import copy
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+_MAX_ENTRIES = 100
+_YAML_CACHE: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+_LOCK = Lock()
+
+
+def load_yaml(path: str) -> Any:
+    """Safely load a YAML file, reusing the parse while the file is unchanged.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        A deep copy of the parsed document
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+
+    with _LOCK:
+        if key in _YAML_CACHE:
+            _YAML_CACHE.move_to_end(key)
+            return copy.deepcopy(_YAML_CACHE[key])
+
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    with _LOCK:
+        _YAML_CACHE[key] = data
+        while len(_YAML_CACHE) > _MAX_ENTRIES:
+            _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+
+def clear_yaml_cache() -> None:
+    """Drop all cached YAML documents."""
+    with _LOCK:
+        _YAML_CACHE.clear()
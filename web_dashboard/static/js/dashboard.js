@@ -70,9 +70,13 @@ class TradingDashboard {
             
             console.log('✅ Trading Dashboard initialized successfully');
             
+            // Readiness flag for UI tests: set once the first frame with data is painted
+            requestAnimationFrame(() => { window.__chartReady = true; });
+            
         } catch (error) {
             console.error('❌ Dashboard initialization failed:', error);
             this.showError('Failed to initialize dashboard');
+            window.__chartReady = false;
         }
     }
 